@@ -114,17 +114,65 @@ class Evaluator(ABC):
     def _load_data(
             self, set_name: str = "test",
             subset_idx: Optional[List[int]] = None) -> AnnotatedExampleSet:
-        # load data
-        examples_file: str = self.learner.get_examples_file(set_name)
-        annotations_file: str = self.learner.get_annotations_file(set_name)
-        x, y = self.learner.parse_examples_data(examples_file)
-        annotations, _ = self.learner.parse_annotations_data(annotations_file)
+        x, y, annotations = self._parse_set(set_name)
 
         if subset_idx is None:
             return AnnotatedExampleSet(x, y, annotations)
         else:
             return self._subset(subset_idx, x, y, annotations)
 
+    def _parse_set(self, set_name: str) -> AnnotatedExampleSet:
+        """Parse a set's examples and annotations, cached per learner.
+
+        Evaluators run back to back on the same sets; caching the
+        parsed files on the learner means each set is read once per
+        seqgra call instead of once per evaluator. Subset operations
+        build new lists, so the cached ones are never mutated.
+        """
+        cache = getattr(self.learner, "_example_set_cache", None)
+        if cache is None:
+            cache = {}
+            self.learner._example_set_cache = cache
+        data = cache.get(set_name)
+        if data is None:
+            examples_file: str = self.learner.get_examples_file(set_name)
+            annotations_file: str = self.learner.get_annotations_file(set_name)
+            x, y = self.learner.parse_examples_data(examples_file)
+            annotations, _ = self.learner.parse_annotations_data(
+                annotations_file)
+            data = AnnotatedExampleSet(x, y, annotations)
+            cache[set_name] = data
+        return data
+
+    def _get_predictions(self, x: List[str], y: List[str]):
+        """Encode labels and predict examples, reusing cached results.
+
+        The conventional evaluators run back to back on the same
+        example set; caching the last scored set on the learner lets
+        them share one forward pass instead of re-scoring per
+        evaluator.
+        """
+        # the tuples themselves are the key; dict lookup compares the
+        # hash and then the values, so a hash collision cannot return
+        # another set's predictions
+        key = (tuple(x), tuple(y))
+        cache = getattr(self.learner, "_prediction_cache", None)
+        if cache is None:
+            cache = {}
+            self.learner._prediction_cache = cache
+        cached = cache.get(key)
+        if cached is not None:
+            return cached
+
+        encoded_y = self.learner.encode_y(y)
+        y_hat = self.learner.predict(x=x)
+        if len(cache) > 8:
+            # one entry per example set is expected; guard against
+            # unbounded growth with repeated subset selections
+            cache.clear()
+        cache[key] = (encoded_y, y_hat)
+        return encoded_y, y_hat
+
     @abstractmethod
     def _evaluate_model(self, x: List[str], y: List[str],
                         annotations: List[str]) -> Any:
@@ -200,10 +248,7 @@ class Evaluator(ABC):
         Returns:
             TODO
         """
-        examples_file: str = self.learner.get_examples_file(set_name)
-        annotations_file: str = self.learner.get_annotations_file(set_name)
-        x, y = self.learner.parse_examples_data(examples_file)
-        annotations, _ = self.learner.parse_annotations_data(annotations_file)
+        x, y, annotations = self._parse_set(set_name)
 
         if labels is not None:
             # discard examples with y not in labels
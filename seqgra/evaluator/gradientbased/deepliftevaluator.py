@@ -4,7 +4,6 @@ import types
 from typing import Optional
 
 import torch
-from torch.autograd import Variable
 import torch.nn.functional as F
 
 import seqgra.constants as c
@@ -23,6 +22,9 @@ class DeepLiftEvaluator(AbstractGradientEvaluator):
                  silent: bool = False) -> None:
         super().__init__(c.EvaluatorID.DEEP_LIFT, "DeepLIFT", learner,
                          output_dir, importance_threshold, silent=silent)
+        # the rescale rule divides by small activation deltas, which is
+        # numerically sensitive in reduced precision
+        self.use_amp = False
         self._prepare_reference()
         assert(baseline_type in ["neutral", "zeros", "shuffled"])
         self.baseline_inp = None
@@ -77,7 +79,6 @@ class DeepLiftEvaluator(AbstractGradientEvaluator):
                 self.baseline_inp = self.baseline_inp[:, :, torch.randperm(
                     self.baseline_inp.size()[2])]
             # TODO baseline_inp with shuffled k-mers??
-            self.baseline_inp = Variable(self.baseline_inp)
 
         # get ref
         _ = self.learner.model(self.baseline_inp)
@@ -5,7 +5,6 @@ from typing import Optional
 
 import torch
 from torch import optim
-from torch.autograd import Variable
 from torch.nn import Parameter
 import torch.nn.functional as F
 
@@ -41,11 +40,10 @@ class FeedbackEvaluator(AbstractGradientEvaluator):
 
         mask = torch.zeros(self.input_size[0], self.class_num).to(self.learner.device)
         mask.scatter_(1, y.unsqueeze(1), 1)
-        mask_var = Variable(mask)
 
         for j in range(self.max_iters):
             output = self.learner.model(x)
-            loss = -(output * mask_var).sum()
+            loss = -(output * mask).sum()
 
             for v in self.control_gates:
                 loss += self.lambd * v.abs().sum()
@@ -62,8 +60,8 @@ class FeedbackEvaluator(AbstractGradientEvaluator):
         
     def _init_control_gates(self):
         self.learner.model.apply(replace_first)
-        input_placeholder = Variable(
-            torch.randn(*self.input_size).to(self.learner.device))
+        input_placeholder = torch.randn(
+            *self.input_size).to(self.learner.device)
         _ = self.learner.model(input_placeholder)
         for m in self.learner.model.modules():
             if m.__class__.__name__ == 'ReLU':
@@ -26,9 +26,11 @@ class GradCamGradientEvaluator(AbstractGradientEvaluator):
         self._register_forward_backward_hook()
 
     def _explainer_transform(self, data, result):
-        return torch.nn.functional.interpolate(result.view(1, 1, -1),
-                                               size=data.shape[2],
-                                               mode="linear").cpu().numpy()
+        # interpolation does not require autograd tracking
+        with torch.inference_mode():
+            return torch.nn.functional.interpolate(result.view(1, 1, -1),
+                                                   size=data.shape[2],
+                                                   mode="linear").cpu().numpy()
 
     def _register_forward_backward_hook(self):
         def forward_hook_input(m, i, o):
@@ -2,7 +2,9 @@
 """
 from abc import abstractmethod
 import math
-from typing import Any, List, Optional
+import os
+import weakref
+from typing import Any, Dict, List, Optional, Tuple
 
 import numpy as np
 import pandas as pd
@@ -19,10 +21,21 @@ class GradientBasedEvaluator(FeatureImportanceEvaluator):
     Only supports PyTorch models.
     """
 
+    AGREEMENT_GROUPS: Any = np.array(["TN", "FP", "FN", "TP"])
+    GRAMMAR_ORD: int = ord(c.PositionType.GRAMMAR)
+
+    # models already moved to a device and set to eval mode, shared across
+    # evaluators operating on the same learner
+    _prepared_models: Any = weakref.WeakKeyDictionary()
+
     @abstractmethod
     def __init__(self, evaluator_id: str, evaluator_name: str,
                  learner: Learner, output_dir: str,
                  importance_threshold: Optional[float] = None,
+                 batch_size: int = 128,
+                 use_amp: bool = False,
+                 use_cuda_graphs: bool = False,
+                 use_arrow_dtypes: bool = False,
                  silent: bool = False) -> None:
         super().__init__(evaluator_id, evaluator_name, learner, output_dir,
                          supported_libraries=[c.LibraryType.TORCH],
@@ -33,6 +46,14 @@ class GradientBasedEvaluator(FeatureImportanceEvaluator):
         else:
             self.importance_threshold = 0.01
 
+        self.batch_size: int = batch_size
+        self.use_amp: bool = use_amp
+        self.use_cuda_graphs: bool = use_cuda_graphs
+        self.use_arrow_dtypes: bool = use_arrow_dtypes
+        self.device: torch.device = self.learner.device
+        self._cuda_graphs: Dict[Tuple[int, ...], Tuple[Any, Any, Any, Any]] = \
+            dict()
+
     @abstractmethod
     def explain(self, x, y):
         pass
@@ -48,32 +69,119 @@ class GradientBasedEvaluator(FeatureImportanceEvaluator):
         encoded_x = self.learner.encode_x(x)
         encoded_y = self.learner.encode_y(y)
 
-        # convert bool to float32 and long, as expected by explainers
-        encoded_x = encoded_x.astype(np.float32)
-        encoded_y = encoded_y.astype(np.int64)
-
         self._check_tensor_dimensions(encoded_x)
-        # convert np array to torch tensor
-        encoded_x = torch.from_numpy(encoded_x)
-        encoded_y = torch.from_numpy(encoded_y)
-
-        # store input tensor, label tensor and model on correct device
-        encoded_x = encoded_x.to(self.learner.device)
-        encoded_y = encoded_y.to(self.learner.device)
-        self.learner.model.to(self.learner.device)
-
-        encoded_x = torch.autograd.Variable(encoded_x, requires_grad=True)
-
-        # enable inference mode
-        self.learner.model.eval()
 
-        fi_matrix = self.explain(encoded_x, encoded_y)
-        fi_matrix = fi_matrix.cpu().numpy()
+        # convert np arrays to float32 and long torch tensors, as expected
+        # by explainers; torch.as_tensor fuses the dtype conversion and the
+        # numpy-to-torch copy into one contiguous allocation
+        encoded_x = torch.as_tensor(encoded_x, dtype=torch.float32)
+        encoded_y = torch.as_tensor(encoded_y, dtype=torch.int64)
+
+        # store input tensor, label tensor and model on correct device;
+        # stage tensors through pinned host memory for asynchronous
+        # host-to-device transfer
+        if self.device.type == "cuda":
+            encoded_x = encoded_x.pin_memory()
+            encoded_y = encoded_y.pin_memory()
+        encoded_x = encoded_x.to(self.device, non_blocking=True)
+        encoded_y = encoded_y.to(self.device, non_blocking=True)
+
+        # move model to device and enable inference mode only once per
+        # model, even when several evaluators share the same learner; the
+        # no-op move still walks all parameters and buffers otherwise
+        model = self.learner.model
+        if GradientBasedEvaluator._prepared_models.get(model) != self.device:
+            model.to(self.device)
+            model.eval()
+            GradientBasedEvaluator._prepared_models[model] = self.device
+
+        # explain examples in batches, concatenate batch results on device,
+        # and transfer feature importance matrix to host only once
+        fi_batches: List[Any] = list()
+        for x_batch, y_batch in zip(
+                torch.split(encoded_x, self.batch_size, dim=0),
+                torch.split(encoded_y, self.batch_size, dim=0)):
+            x_batch.requires_grad_(True)
+            fi_batches.append(self._explain_batch(x_batch, y_batch))
+        with torch.inference_mode():
+            fi_matrix = torch.cat(fi_batches, dim=0)
+
+            # per-position maximum across channels, reduced on device so
+            # _convert_to_data_frame does not recompute it on the host
+            per_position_max = fi_matrix.amax(dim=1)
+            if per_position_max.dim() == 3:
+                # from (N, 1, W) to (N, W)
+                per_position_max = per_position_max.squeeze(1)
+            per_position_max = per_position_max.cpu().numpy()
+
+            self._check_tensor_dimensions(fi_matrix)
+            if fi_matrix.dim() == 4:
+                # drop the singleton height dimension on device so the
+                # host-side array is already (N, C, W)
+                fi_matrix = fi_matrix.squeeze(2)
+            fi_matrix = fi_matrix.cpu().numpy()
 
-        self._check_tensor_dimensions(fi_matrix)
         fi_matrix = self._convert_to_nwc(fi_matrix)
 
-        return (fi_matrix, x, y, annotations)
+        return (fi_matrix, x, y, annotations, per_position_max)
+
+    def _autocast(self):
+        # opt-in: bfloat16 forward passes halve activation memory
+        # bandwidth on Ampere and later GPUs, but change feature
+        # importance values numerically and raise on older devices; the
+        # input leaf stays float32, so its gradient is accumulated in
+        # float32
+        return torch.autocast(
+            "cuda", dtype=torch.bfloat16,
+            enabled=self.use_amp and self.device.type == "cuda")
+
+    def _explain_batch(self, x_batch, y_batch):
+        if not self.use_cuda_graphs or self.device.type != "cuda":
+            with self._autocast():
+                return self.explain(x_batch, y_batch)
+
+        shape_key: Tuple[int, ...] = tuple(x_batch.shape)
+        if shape_key not in self._cuda_graphs:
+            try:
+                self._capture_cuda_graph(shape_key, x_batch, y_batch)
+            except RuntimeError as err:
+                self.logger.warning("CUDA graph capture failed, falling "
+                                    "back to eager execution: %s", err)
+                self.use_cuda_graphs = False
+                return self.explain(x_batch, y_batch)
+
+        graph, static_x, static_y, static_result = \
+            self._cuda_graphs[shape_key]
+        with torch.no_grad():
+            static_x.copy_(x_batch)
+            static_y.copy_(y_batch)
+        if static_x.grad is not None:
+            static_x.grad.zero_()
+        graph.replay()
+        return static_result.clone()
+
+    def _capture_cuda_graph(self, shape_key: Tuple[int, ...],
+                            x_batch, y_batch) -> None:
+        static_x = x_batch.detach().clone().requires_grad_(True)
+        static_y = y_batch.clone()
+
+        # warm up on a side stream before recording the forward and
+        # backward launch sequence for this input shape
+        stream = torch.cuda.Stream()
+        stream.wait_stream(torch.cuda.current_stream())
+        with torch.cuda.stream(stream):
+            for _ in range(3):
+                with self._autocast():
+                    self.explain(static_x, static_y)
+        torch.cuda.current_stream().wait_stream(stream)
+
+        if static_x.grad is not None:
+            static_x.grad.zero_()
+        graph = torch.cuda.CUDAGraph()
+        with torch.cuda.graph(graph), self._autocast():
+            static_result = self.explain(static_x, static_y)
+        self._cuda_graphs[shape_key] = (graph, static_x, static_y,
+                                        static_result)
 
     def get_layer(self, key_list):
         a = self.learner.model
@@ -87,11 +195,8 @@ class GradientBasedEvaluator(FeatureImportanceEvaluator):
             # from (N, H, W, C) to (N, W, C)
             x = np.squeeze(x, axis=1)
         elif self.learner.definition.library == c.LibraryType.TORCH:
-            if self.learner.definition.input_encoding == "2D":
-                # from (N, C, 1, W) to (N, C, W)
-                x = np.squeeze(x, axis=2)
-
-            # from (N, C, W) to (N, W, C)
+            # height dimension of "2D" input encodings is already dropped
+            # on device; from (N, C, W) to (N, W, C)
             x = np.transpose(x, (0, 2, 1))
 
         return x
@@ -128,13 +233,17 @@ class GradientBasedEvaluator(FeatureImportanceEvaluator):
                            "specificity": specificity_column,
                            "f1": f1_column})
 
-        df.to_csv(self.output_dir + set_name + "-df.txt", sep="\t",
-                  index=False)
+        df.to_csv(os.path.join(self.output_dir, set_name + "-df.txt"),
+                  sep="\t", index=False)
 
     def _save_results(self, results, set_name: str = "test",
                       suppress_plots: bool = False) -> None:
-        np.save(self.output_dir + set_name + "-feature-importance-matrix.npy",
-                results[0])
+        file_name: str = os.path.join(
+            self.output_dir, set_name + "-feature-importance-matrix.npy")
+        # ascontiguousarray avoids a hidden temporary copy inside np.save
+        # for the transposed feature importance matrix
+        np.save(file_name, np.ascontiguousarray(results[0]),
+                allow_pickle=False)
         self._write_result_df(results[0], results[1], results[2], results[3],
                               set_name)
 
@@ -147,9 +256,10 @@ class GradientBasedEvaluator(FeatureImportanceEvaluator):
             self, results, set_name: str = "test") -> None:
         df: pd.DataFrame = self._convert_to_data_frame(results)
         if len(df.index) > 0:
-            df.to_csv(self.output_dir + set_name +
-                      "-grammar-agreement-thresholded-df.txt",
-                      sep="\t", index=False)
+            df.to_csv(os.path.join(
+                self.output_dir,
+                set_name + "-grammar-agreement-thresholded-df.txt"),
+                sep="\t", index=False)
 
             pdf_file_name: str = set_name + "-grammar-agreement-thresholded.pdf"
             df: pd.DataFrame = self._prepare_r_data_frame(df)
@@ -164,7 +274,8 @@ class GradientBasedEvaluator(FeatureImportanceEvaluator):
         df: pd.DataFrame = GradientBasedEvaluator._convert_to_unthresholded_data_frame(
             results)
         if len(df.index) > 0:
-            df.to_csv(self.output_dir + set_name + "-grammar-agreement-df.txt",
+            df.to_csv(os.path.join(self.output_dir,
+                                   set_name + "-grammar-agreement-df.txt"),
                       sep="\t", index=False)
 
             pdf_file_name: str = set_name + "-grammar-agreement.pdf"
@@ -271,38 +382,72 @@ class GradientBasedEvaluator(FeatureImportanceEvaluator):
         y: List[str] = results[2]
         annotations: List[str] = results[3]
 
-        example_column: List[int] = list()
-        position_column: List[int] = list()
-        group_column: List[str] = list()
-        label_column: List[str] = list()
-
+        # maximum importance across channels, computed once for all
+        # (example, position) pairs; reuse the device-side reduction if
+        # _evaluate_model provided it
+        if len(results) > 4:
+            per_position_max = results[4]
+        else:
+            per_position_max = fi_matrix.max(axis=2)
+
+        lengths = np.fromiter((len(annotation) for annotation in annotations),
+                              dtype=np.int64, count=len(annotations))
+        total: int = int(lengths.sum())
+        example_column = np.repeat(np.arange(len(annotations),
+                                             dtype=np.int32), lengths)
+        label_column = np.repeat(np.asarray(y, dtype=object), lengths)
+
+        # fill preallocated flat arrays slice by slice instead of
+        # accumulating per-example arrays and concatenating them
+        position_column = np.empty(total, dtype=np.int32)
+        group_codes = np.empty(total, dtype=np.int8)
+        offset: int = 0
         for example_id, annotation in enumerate(annotations):
-            example_column += [example_id] * len(annotation)
-            position_column += list(range(1, len(annotation) + 1))
-            group_column += [self.__get_agreement_group(
-                char, fi_matrix[example_id, i, :])
-                for i, char in enumerate(annotation)]
-            label_column += [y[example_id]] * len(annotation)
-
-        df = pd.DataFrame({"example": example_column,
-                           "position": position_column,
-                           "group": group_column,
-                           "label": label_column})
+            end: int = offset + len(annotation)
+            position_column[offset:end] = np.arange(1, len(annotation) + 1)
+            group_codes[offset:end] = self.__get_agreement_group_codes(
+                annotation, per_position_max[example_id, :len(annotation)])
+            offset = end
+
+        if self.use_arrow_dtypes:
+            # PyArrow-backed columns skip pandas' block conversion and
+            # speed up downstream groupbys on very large frames
+            import pyarrow as pa  # pylint: disable=import-outside-toplevel
+            df = pd.DataFrame({
+                "example": pd.arrays.ArrowExtensionArray(
+                    pa.array(example_column, type=pa.int32())),
+                "position": pd.arrays.ArrowExtensionArray(
+                    pa.array(position_column, type=pa.int32())),
+                "group": pd.arrays.ArrowExtensionArray(
+                    pa.DictionaryArray.from_arrays(
+                        pa.array(group_codes, type=pa.int8()),
+                        pa.array(list(
+                            GradientBasedEvaluator.AGREEMENT_GROUPS)))),
+                "label": pd.arrays.ArrowExtensionArray(
+                    pa.array(label_column).dictionary_encode())})
+        else:
+            # categorical columns store int8 codes instead of one Python
+            # string object per row
+            df = pd.DataFrame({"example": example_column,
+                               "position": position_column,
+                               "group": pd.Categorical.from_codes(
+                                   group_codes,
+                                   categories=list(
+                                       GradientBasedEvaluator.AGREEMENT_GROUPS)),
+                               "label": pd.Categorical(label_column)})
 
         return df
 
-    def __get_agreement_group(self, annotation_position: str,
-                              importance_vector) -> str:
-        if annotation_position == c.PositionType.GRAMMAR:
-            if np.max(importance_vector) < self.importance_threshold:
-                return "FN"
-            else:
-                return "TP"
-        else:
-            if np.max(importance_vector) < self.importance_threshold:
-                return "TN"
-            else:
-                return "FP"
+    def __get_agreement_group_codes(self, annotation: str,
+                                    per_position_max) -> Any:
+        # byte-level comparison against the grammar position character
+        # instead of a Python loop over the annotation string; codes index
+        # into AGREEMENT_GROUPS
+        grammar_mask = np.frombuffer(
+            annotation.encode("latin-1"),
+            dtype=np.uint8) == GradientBasedEvaluator.GRAMMAR_ORD
+        above_threshold = per_position_max >= self.importance_threshold
+        return grammar_mask * 2 + above_threshold
 
     @staticmethod
     def _convert_to_unthresholded_data_frame(results) -> pd.DataFrame:
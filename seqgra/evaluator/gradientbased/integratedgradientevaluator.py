@@ -3,7 +3,6 @@
 from typing import Optional
 
 import numpy as np
-from torch.autograd import Variable
 
 import seqgra.constants as c
 from seqgra.learner import Learner
@@ -28,7 +27,7 @@ class IntegratedGradientEvaluator(AbstractGradientEvaluator):
         x_data = x.data.clone()
 
         for alpha in np.arange(1 / self.steps, 1.0, 1 / self.steps):
-            new_x = Variable(x_data * alpha, requires_grad=True)
+            new_x = (x_data * alpha).requires_grad_(True)
             g = self._backprop(new_x, y)
             grad += g
 
@@ -5,7 +5,6 @@ from typing import Optional
 import numpy as np
 from sklearn.neighbors import BallTree
 import torch
-from torch.autograd import Variable
 
 import seqgra.constants as c
 from seqgra.evaluator.gradientbased import AbstractGradientEvaluator
@@ -45,8 +44,8 @@ class NonlinearIntegratedGradientEvaluator(AbstractGradientEvaluator):
         for i in range(nsteps):
             new_x = torch.from_numpy(new_data[i])
             new_x = new_x.float()
-            new_x = Variable(new_x.unsqueeze(0).to(self.learner.device),
-                             requires_grad=True)
+            new_x = new_x.unsqueeze(0).to(
+                self.learner.device).requires_grad_(True)
             g = self._backprop(new_x, y)
             grad += g
 
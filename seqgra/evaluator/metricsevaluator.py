@@ -9,8 +9,6 @@ calculates accuracy and loss for training, validation and test set
 """
 from typing import Any, List
 
-import pandas as pd
-
 import seqgra.constants as c
 from seqgra.learner import Learner
 from seqgra.evaluator import Evaluator
@@ -28,12 +26,10 @@ class MetricsEvaluator(Evaluator):
 
     def _save_results(self, results, set_name: str = "test",
                       suppress_plots: bool = False) -> None:
-        if results is None:
-            df = pd.DataFrame([], columns=["set", "metric", "value"])
-        else:
-            df = pd.DataFrame([[set_name, "loss", results["loss"]],
-                               [set_name, "accuracy", results["accuracy"]]],
-                              columns=["set", "metric", "value"])
-
-        df.to_csv(self.output_dir + set_name + "-metrics.txt", sep="\t",
-                  index=False)
+        # two values do not warrant a data frame; write the TSV directly
+        with open(self.output_dir + set_name + "-metrics.txt", "w") as f:
+            f.write("set\tmetric\tvalue\n")
+            if results is not None:
+                f.write(set_name + "\tloss\t" + str(results["loss"]) + "\n")
+                f.write(set_name + "\taccuracy\t" +
+                        str(results["accuracy"]) + "\n")
@@ -7,7 +7,7 @@ predict evaluator: writes model predictions of all examples in set to file
 """
 from typing import Any, List
 
-import pandas as pd
+import numpy as np
 
 import seqgra.constants as c
 from seqgra.learner import Learner
@@ -22,21 +22,23 @@ class PredictEvaluator(Evaluator):
 
     def _evaluate_model(self, x: List[str], y: List[str],
                         annotations: List[str]) -> Any:
-        encoded_y = self.learner.encode_y(y)
-        y_hat = self.learner.predict(x=x)
-
-        return (encoded_y, y_hat)
+        return self._get_predictions(x, y)
 
     def _save_results(self, results, set_name: str = "test",
-                      suppress_plots: bool = False) -> None:
+                      suppress_plots: bool = False,
+                      chunk: int = 65536) -> None:
         if results is not None:
-            y_df = pd.DataFrame(
-                results[0], columns=["y_" + s
-                                     for s in self.learner.definition.labels])
-            y_hat_df = pd.DataFrame(
-                results[1],
-                columns=["y_hat_" + s
-                         for s in self.learner.definition.labels])
-            df = pd.concat([y_df, y_hat_df], axis=1)
-            df.to_csv(self.output_dir + set_name + "-y-hat.txt", sep="\t",
-                      index=False)
+            labels = self.learner.definition.labels
+            header: str = "\t".join(["y_" + s for s in labels] +
+                                    ["y_hat_" + s for s in labels])
+            y_hat = np.asarray(results[1])
+            y = np.asarray(results[0]).astype(y_hat.dtype)
+
+            # stream row blocks instead of materializing the full
+            # prediction matrix in a data frame before formatting
+            with open(self.output_dir + set_name + "-y-hat.txt", "w") as f:
+                f.write(header + "\n")
+                for i in range(0, len(y_hat), chunk):
+                    np.savetxt(f, np.hstack((y[i:i + chunk],
+                                             y_hat[i:i + chunk])),
+                               fmt="%.6g", delimiter="\t")
@@ -25,10 +25,7 @@ class PREvaluator(Evaluator):
 
     def _evaluate_model(self, x: List[str], y: List[str],
                         annotations: List[str]) -> Any:
-        encoded_y = self.learner.encode_y(y)
-        y_hat = self.learner.predict(x=x)
-
-        return (encoded_y, y_hat)
+        return self._get_predictions(x, y)
 
     def _save_results(self, results, set_name: str = "test",
                       suppress_plots: bool = False) -> None:
@@ -187,7 +187,7 @@ def make_empty_boolean_mask(shape):
     Returns:
       ndarray of given shape and boolean type, all values are True (not masked).
     """
-    return np.full(shape, True, dtype=np.bool)
+    return np.full(shape, True, dtype=np.bool_)
 
 
 def make_empty_boolean_mask_broadcast_over_axis(shape, axis):
@@ -5,9 +5,13 @@ Class with miscellaneous helper functions as static methods
 
 @author: Konstantin Krismer
 """
-import os
+import functools
+import importlib
+from dataclasses import dataclass
 from typing import List, Optional
 
+import os
+
 import seqgra.constants as c
 from seqgra.comparator import Comparator
 from seqgra.comparator import PRComparator
@@ -17,13 +21,133 @@ from seqgra.comparator import CurveTableComparator
 from seqgra.comparator import FIETableComparator
 from seqgra.evaluator import Evaluator
 from seqgra.learner import Learner
-from seqgra.learner.bayes import BayesOptimalDNAMultiClassClassificationLearner
-from seqgra.learner.bayes import BayesOptimalDNAMultiLabelClassificationLearner
-from seqgra.learner.bayes import BayesOptimalProteinMultiClassClassificationLearner
-from seqgra.learner.bayes import BayesOptimalProteinMultiLabelClassificationLearner
 from seqgra.model import DataDefinition
 from seqgra.model import ModelDefinition
 
+_BAYES_MODULE = "seqgra.learner.bayes"
+
+# learner classes are resolved through importlib so TensorFlow and
+# PyTorch are only imported when a learner actually needs them
+_LEARNER_BY_TRIPLE = {
+    (c.TaskType.MULTI_CLASS_CLASSIFICATION, c.SequenceSpaceType.DNA,
+     c.LibraryType.TENSORFLOW):
+        ("seqgra.learner.tensorflow",
+         "KerasDNAMultiClassClassificationLearner"),
+    (c.TaskType.MULTI_CLASS_CLASSIFICATION, c.SequenceSpaceType.DNA,
+     c.LibraryType.TORCH):
+        ("seqgra.learner.torch",
+         "TorchDNAMultiClassClassificationLearner"),
+    (c.TaskType.MULTI_CLASS_CLASSIFICATION, c.SequenceSpaceType.DNA,
+     c.LibraryType.BAYES_OPTIMAL_CLASSIFIER):
+        (_BAYES_MODULE, "BayesOptimalDNAMultiClassClassificationLearner"),
+    (c.TaskType.MULTI_CLASS_CLASSIFICATION, c.SequenceSpaceType.PROTEIN,
+     c.LibraryType.TENSORFLOW):
+        ("seqgra.learner.tensorflow",
+         "KerasProteinMultiClassClassificationLearner"),
+    (c.TaskType.MULTI_CLASS_CLASSIFICATION, c.SequenceSpaceType.PROTEIN,
+     c.LibraryType.TORCH):
+        ("seqgra.learner.torch",
+         "TorchProteinMultiClassClassificationLearner"),
+    (c.TaskType.MULTI_CLASS_CLASSIFICATION, c.SequenceSpaceType.PROTEIN,
+     c.LibraryType.BAYES_OPTIMAL_CLASSIFIER):
+        (_BAYES_MODULE,
+         "BayesOptimalProteinMultiClassClassificationLearner"),
+    (c.TaskType.MULTI_LABEL_CLASSIFICATION, c.SequenceSpaceType.DNA,
+     c.LibraryType.TENSORFLOW):
+        ("seqgra.learner.tensorflow",
+         "KerasDNAMultiLabelClassificationLearner"),
+    (c.TaskType.MULTI_LABEL_CLASSIFICATION, c.SequenceSpaceType.DNA,
+     c.LibraryType.TORCH):
+        ("seqgra.learner.torch",
+         "TorchDNAMultiLabelClassificationLearner"),
+    (c.TaskType.MULTI_LABEL_CLASSIFICATION, c.SequenceSpaceType.DNA,
+     c.LibraryType.BAYES_OPTIMAL_CLASSIFIER):
+        (_BAYES_MODULE, "BayesOptimalDNAMultiLabelClassificationLearner"),
+    (c.TaskType.MULTI_LABEL_CLASSIFICATION, c.SequenceSpaceType.PROTEIN,
+     c.LibraryType.TENSORFLOW):
+        ("seqgra.learner.tensorflow",
+         "KerasProteinMultiLabelClassificationLearner"),
+    (c.TaskType.MULTI_LABEL_CLASSIFICATION, c.SequenceSpaceType.PROTEIN,
+     c.LibraryType.TORCH):
+        ("seqgra.learner.torch",
+         "TorchProteinMultiLabelClassificationLearner"),
+    (c.TaskType.MULTI_LABEL_CLASSIFICATION, c.SequenceSpaceType.PROTEIN,
+     c.LibraryType.BAYES_OPTIMAL_CLASSIFIER):
+        (_BAYES_MODULE,
+         "BayesOptimalProteinMultiLabelClassificationLearner"),
+}
+
+_LEARNER_BY_IMPLEMENTATION = {
+    class_name: (module_path, class_name)
+    for module_path, class_name in _LEARNER_BY_TRIPLE.values()
+}
+
+
+_GRADIENT_BASED_MODULE = "seqgra.evaluator.gradientbased"
+
+
+@dataclass(frozen=True)
+class EvaluatorInfo:
+    """Dispatch metadata for one evaluator ID."""
+    module: str
+    cls: str
+    kind: str
+
+
+def _conventional(cls_name: str) -> EvaluatorInfo:
+    return EvaluatorInfo("seqgra.evaluator", cls_name, "conventional")
+
+
+def _gradient_based(cls_name: str) -> EvaluatorInfo:
+    return EvaluatorInfo(_GRADIENT_BASED_MODULE, cls_name, "gradient-based")
+
+
+# single source for module, class, and evaluator category; dispatch and
+# constructor-signature selection are both one dict lookup
+_EVALUATOR_INFO = {
+    c.EvaluatorID.METRICS: _conventional("MetricsEvaluator"),
+    c.EvaluatorID.PREDICT: _conventional("PredictEvaluator"),
+    c.EvaluatorID.ROC: _conventional("ROCEvaluator"),
+    c.EvaluatorID.PR: _conventional("PREvaluator"),
+    c.EvaluatorID.SIS:
+        EvaluatorInfo("seqgra.evaluator", "SISEvaluator",
+                      "model-agnostic"),
+    c.EvaluatorID.GRADIENT:
+        _gradient_based("GradientEvaluator"),
+    c.EvaluatorID.GRADIENT_X_INPUT:
+        _gradient_based("GradientxInputEvaluator"),
+    c.EvaluatorID.SALIENCY:
+        _gradient_based("SaliencyEvaluator"),
+    c.EvaluatorID.FEEDBACK:
+        _gradient_based("FeedbackEvaluator"),
+    c.EvaluatorID.GUIDED_BACKPROP:
+        _gradient_based("GuidedBackpropEvaluator"),
+    c.EvaluatorID.DECONV:
+        _gradient_based("DeconvEvaluator"),
+    c.EvaluatorID.SMOOTH_GRAD:
+        _gradient_based("SmoothGradEvaluator"),
+    c.EvaluatorID.INTEGRATED_GRADIENTS:
+        _gradient_based("IntegratedGradientEvaluator"),
+    c.EvaluatorID.NONLINEAR_INTEGRATED_GRADIENTS:
+        _gradient_based("NonlinearIntegratedGradientEvaluator"),
+    c.EvaluatorID.GRAD_CAM:
+        _gradient_based("GradCamGradientEvaluator"),
+    c.EvaluatorID.DEEP_LIFT:
+        _gradient_based("DeepLiftEvaluator"),
+    c.EvaluatorID.EXCITATION_BACKPROP:
+        _gradient_based("ExcitationBackpropEvaluator"),
+    c.EvaluatorID.CONTRASTIVE_EXCITATION_BACKPROP:
+        _gradient_based("ContrastiveExcitationBackpropEvaluator"),
+}
+
+
+@functools.cache
+def _resolve(module_path: str, cls_name: str):
+    # repeated resolutions collapse to a dict hit instead of going
+    # through the import machinery every call
+    return getattr(importlib.import_module(module_path), cls_name)
+
+
 class IdResolver:
     @staticmethod
     def get_learner(model_definition: ModelDefinition,
@@ -32,168 +156,55 @@ class IdResolver:
                     validate_data: bool,
                     gpu_id: int,
                     silent: bool) -> Learner:
+        task: str = model_definition.task
+        sequence_space: str = model_definition.sequence_space
+        library: str = model_definition.library
+        implementation: Optional[str] = model_definition.implementation
+
         if data_definition is not None:
-            if model_definition.task != data_definition.task:
-                raise Exception("model and grammar task incompatible (" +
-                                "model task: " + model_definition.task +
-                                ", grammar task: " + data_definition.task + ")")
-            if model_definition.sequence_space != data_definition.sequence_space:
-                raise Exception("model and grammar sequence space incompatible (" +
-                                "model sequence space: " +
-                                model_definition.sequence_space +
-                                ", grammar sequence space: " +
-                                data_definition.sequence_space + ")")
+            if task != data_definition.task:
+                raise Exception(
+                    f"model and grammar task incompatible (model task: "
+                    f"{task}, grammar task: {data_definition.task})")
+            if sequence_space != data_definition.sequence_space:
+                raise Exception(
+                    f"model and grammar sequence space incompatible "
+                    f"(model sequence space: {sequence_space}, grammar "
+                    f"sequence space: {data_definition.sequence_space})")
 
-        if model_definition.library == c.LibraryType.TENSORFLOW:
+        if library == c.LibraryType.TENSORFLOW:
             os.environ["TF_CPP_MIN_LOG_LEVEL"] = "1"
 
-        # imports are inside if branches to only depend on TensorFlow and PyTorch
-        # when required
-        if model_definition.implementation is None:
-            if model_definition.task == c.TaskType.MULTI_CLASS_CLASSIFICATION:
-                if model_definition.sequence_space == c.SequenceSpaceType.DNA:
-                    if model_definition.library == c.LibraryType.TENSORFLOW:
-                        from seqgra.learner.tensorflow import KerasDNAMultiClassClassificationLearner  # pylint: disable=import-outside-toplevel
-                        return KerasDNAMultiClassClassificationLearner(
-                            model_definition, data_dir, output_dir, validate_data,
-                            gpu_id, silent)
-                    elif model_definition.library == c.LibraryType.TORCH:
-                        from seqgra.learner.torch import TorchDNAMultiClassClassificationLearner  # pylint: disable=import-outside-toplevel
-                        return TorchDNAMultiClassClassificationLearner(
-                            model_definition, data_dir, output_dir, validate_data,
-                            gpu_id, silent)
-                    elif model_definition.library == c.LibraryType.BAYES_OPTIMAL_CLASSIFIER:
-                        return BayesOptimalDNAMultiClassClassificationLearner(
-                            model_definition, data_dir, output_dir, validate_data,
-                            silent)
-                    else:
-                        raise Exception("invalid library: " +
-                                        model_definition.library)
-                elif model_definition.sequence_space == c.SequenceSpaceType.PROTEIN:
-                    if model_definition.library == c.LibraryType.TENSORFLOW:
-                        from seqgra.learner.tensorflow import KerasProteinMultiClassClassificationLearner  # pylint: disable=import-outside-toplevel
-                        return KerasProteinMultiClassClassificationLearner(
-                            model_definition, data_dir, output_dir, validate_data,
-                            gpu_id, silent)
-                    elif model_definition.library == c.LibraryType.TORCH:
-                        from seqgra.learner.torch import TorchProteinMultiClassClassificationLearner  # pylint: disable=import-outside-toplevel
-                        return TorchProteinMultiClassClassificationLearner(
-                            model_definition, data_dir, output_dir, validate_data,
-                            gpu_id, silent)
-                    elif model_definition.library == c.LibraryType.BAYES_OPTIMAL_CLASSIFIER:
-                        return BayesOptimalProteinMultiClassClassificationLearner(
-                            model_definition, data_dir, output_dir, validate_data,
-                            silent)
-                    else:
-                        raise Exception("invalid library: " +
-                                        model_definition.library)
-                else:
-                    raise Exception("invalid model sequence space: " +
-                                    model_definition.sequence_space)
-            elif model_definition.task == c.TaskType.MULTI_LABEL_CLASSIFICATION:
-                if model_definition.sequence_space == c.SequenceSpaceType.DNA:
-                    if model_definition.library == c.LibraryType.TENSORFLOW:
-                        from seqgra.learner.tensorflow import KerasDNAMultiLabelClassificationLearner  # pylint: disable=import-outside-toplevel
-                        return KerasDNAMultiLabelClassificationLearner(
-                            model_definition, data_dir, output_dir, validate_data,
-                            gpu_id, silent)
-                    elif model_definition.library == c.LibraryType.TORCH:
-                        from seqgra.learner.torch import TorchDNAMultiLabelClassificationLearner  # pylint: disable=import-outside-toplevel
-                        return TorchDNAMultiLabelClassificationLearner(
-                            model_definition, data_dir, output_dir, validate_data,
-                            gpu_id, silent)
-                    elif model_definition.library == c.LibraryType.BAYES_OPTIMAL_CLASSIFIER:
-                        return BayesOptimalDNAMultiLabelClassificationLearner(
-                            model_definition, data_dir, output_dir, validate_data,
-                            silent)
-                    else:
-                        raise Exception("invalid library: " +
-                                        model_definition.library)
-                elif model_definition.sequence_space == c.SequenceSpaceType.PROTEIN:
-                    if model_definition.library == c.LibraryType.TENSORFLOW:
-                        from seqgra.learner.tensorflow import KerasProteinMultiLabelClassificationLearner  # pylint: disable=import-outside-toplevel
-                        return KerasProteinMultiLabelClassificationLearner(
-                            model_definition, data_dir, output_dir, validate_data,
-                            gpu_id, silent)
-                    elif model_definition.library == c.LibraryType.TORCH:
-                        from seqgra.learner.torch import TorchProteinMultiLabelClassificationLearner  # pylint: disable=import-outside-toplevel
-                        return TorchProteinMultiLabelClassificationLearner(
-                            model_definition, data_dir, output_dir, validate_data,
-                            gpu_id, silent)
-                    elif model_definition.library == c.LibraryType.BAYES_OPTIMAL_CLASSIFIER:
-                        return BayesOptimalProteinMultiLabelClassificationLearner(
-                            model_definition, data_dir, output_dir, validate_data,
-                            silent)
-                    else:
-                        raise Exception("invalid library: " +
-                                        model_definition.library)
-                else:
-                    raise Exception("invalid model sequence space: " +
-                                    model_definition.sequence_space)
-            elif model_definition.task == c.TaskType.MULTIPLE_REGRESSION:
-                raise NotImplementedError("implementation for multiple "
-                                          "regression not available")
-            elif model_definition.task == c.TaskType.MULTIVARIATE_REGRESSION:
-                raise NotImplementedError("implementation for multivariate "
-                                          "regression not available")
-            else:
-                raise Exception("invalid model task: " + model_definition.task)
+        if implementation is None:
+            entry = _LEARNER_BY_TRIPLE.get((task, sequence_space, library))
+            if entry is None:
+                if task == c.TaskType.MULTIPLE_REGRESSION:
+                    raise NotImplementedError("implementation for multiple "
+                                              "regression not available")
+                if task == c.TaskType.MULTIVARIATE_REGRESSION:
+                    raise NotImplementedError("implementation for "
+                                              "multivariate regression "
+                                              "not available")
+                if task not in c.TaskType.ALL_TASKS:
+                    raise Exception(f"invalid model task: {task}")
+                if sequence_space not in \
+                        c.SequenceSpaceType.ALL_SEQUENCE_SPACES:
+                    raise Exception(
+                        f"invalid model sequence space: {sequence_space}")
+                raise Exception(f"invalid library: {library}")
         else:
-            if model_definition.implementation == "KerasDNAMultiClassClassificationLearner":
-                from seqgra.learner.tensorflow import KerasDNAMultiClassClassificationLearner  # pylint: disable=import-outside-toplevel
-                return KerasDNAMultiClassClassificationLearner(
-                    model_definition, data_dir, output_dir, validate_data, gpu_id,
-                    silent)
-            elif model_definition.implementation == "KerasDNAMultiLabelClassificationLearner":
-                from seqgra.learner.tensorflow import KerasDNAMultiLabelClassificationLearner  # pylint: disable=import-outside-toplevel
-                return KerasDNAMultiLabelClassificationLearner(
-                    model_definition, data_dir, output_dir, validate_data, gpu_id,
-                    silent)
-            elif model_definition.implementation == "TorchDNAMultiClassClassificationLearner":
-                from seqgra.learner.torch import TorchDNAMultiClassClassificationLearner  # pylint: disable=import-outside-toplevel
-                return TorchDNAMultiClassClassificationLearner(
-                    model_definition, data_dir, output_dir, validate_data, gpu_id,
-                    silent)
-            elif model_definition.implementation == "TorchDNAMultiLabelClassificationLearner":
-                from seqgra.learner.torch import TorchDNAMultiLabelClassificationLearner  # pylint: disable=import-outside-toplevel
-                return TorchDNAMultiLabelClassificationLearner(
-                    model_definition, data_dir, output_dir, validate_data, gpu_id,
-                    silent)
-            elif model_definition.implementation == "BayesOptimalDNAMultiClassClassificationLearner":
-                return BayesOptimalDNAMultiClassClassificationLearner(
-                    model_definition, data_dir, output_dir, validate_data, silent)
-            elif model_definition.implementation == "BayesOptimalDNAMultiLabelClassificationLearner":
-                return BayesOptimalDNAMultiLabelClassificationLearner(
-                    model_definition, data_dir, output_dir, validate_data, silent)
-            elif model_definition.implementation == "KerasProteinMultiClassClassificationLearner":
-                from seqgra.learner.tensorflow import KerasProteinMultiClassClassificationLearner  # pylint: disable=import-outside-toplevel
-                return KerasProteinMultiClassClassificationLearner(
-                    model_definition, data_dir, output_dir, validate_data, gpu_id,
-                    silent)
-            elif model_definition.implementation == "KerasProteinMultiLabelClassificationLearner":
-                from seqgra.learner.tensorflow import KerasProteinMultiLabelClassificationLearner  # pylint: disable=import-outside-toplevel
-                return KerasProteinMultiLabelClassificationLearner(
-                    model_definition, data_dir, output_dir, validate_data, gpu_id,
-                    silent)
-            elif model_definition.implementation == "TorchProteinMultiClassClassificationLearner":
-                from seqgra.learner.torch import TorchProteinMultiClassClassificationLearner  # pylint: disable=import-outside-toplevel
-                return TorchProteinMultiClassClassificationLearner(
-                    model_definition, data_dir, output_dir, validate_data, gpu_id,
-                    silent)
-            elif model_definition.implementation == "TorchProteinMultiLabelClassificationLearner":
-                from seqgra.learner.torch import TorchProteinMultiLabelClassificationLearner  # pylint: disable=import-outside-toplevel
-                return TorchProteinMultiLabelClassificationLearner(
-                    model_definition, data_dir, output_dir, validate_data, gpu_id,
-                    silent)
-            elif model_definition.implementation == "BayesOptimalProteinMultiClassClassificationLearner":
-                return BayesOptimalProteinMultiClassClassificationLearner(
-                    model_definition, data_dir, output_dir, validate_data, silent)
-            elif model_definition.implementation == "BayesOptimalProteinMultiLabelClassificationLearner":
-                return BayesOptimalProteinMultiLabelClassificationLearner(
-                    model_definition, data_dir, output_dir, validate_data, silent)
-            else:
+            entry = _LEARNER_BY_IMPLEMENTATION.get(implementation)
+            if entry is None:
                 raise Exception("invalid learner ID")
 
+        module_path, class_name = entry
+        learner_class = _resolve(module_path, class_name)
+        if module_path == _BAYES_MODULE:
+            return learner_class(model_definition, data_dir, output_dir,
+                                 validate_data, silent)
+        return learner_class(model_definition, data_dir, output_dir,
+                             validate_data, gpu_id, silent)
+
     @staticmethod
     def get_evaluator(evaluator_id: str, learner: Learner,
                       output_dir: str,
@@ -205,77 +216,21 @@ class IdResolver:
         if learner is None:
             raise Exception("no learner specified")
 
-        if evaluator_id == c.EvaluatorID.METRICS:
-            from seqgra.evaluator import MetricsEvaluator  # pylint: disable=import-outside-toplevel
-            return MetricsEvaluator(learner, output_dir, silent)
-        elif evaluator_id == c.EvaluatorID.PREDICT:
-            from seqgra.evaluator import PredictEvaluator  # pylint: disable=import-outside-toplevel
-            return PredictEvaluator(learner, output_dir, silent)
-        elif evaluator_id == c.EvaluatorID.ROC:
-            from seqgra.evaluator import ROCEvaluator  # pylint: disable=import-outside-toplevel
-            return ROCEvaluator(learner, output_dir, silent)
-        elif evaluator_id == c.EvaluatorID.PR:
-            from seqgra.evaluator import PREvaluator  # pylint: disable=import-outside-toplevel
-            return PREvaluator(learner, output_dir, silent)
-        elif evaluator_id == c.EvaluatorID.SIS:
-            from seqgra.evaluator import SISEvaluator  # pylint: disable=import-outside-toplevel
-            return SISEvaluator(learner, output_dir, eval_sis_predict_threshold,
-                                silent=silent)
-        elif evaluator_id == c.EvaluatorID.GRADIENT:
-            from seqgra.evaluator.gradientbased import GradientEvaluator  # pylint: disable=import-outside-toplevel
-            return GradientEvaluator(
-                learner, output_dir, eval_grad_importance_threshold, silent=silent)
-        elif evaluator_id == c.EvaluatorID.GRADIENT_X_INPUT:
-            from seqgra.evaluator.gradientbased import GradientxInputEvaluator  # pylint: disable=import-outside-toplevel
-            return GradientxInputEvaluator(
-                learner, output_dir, eval_grad_importance_threshold, silent=silent)
-        elif evaluator_id == c.EvaluatorID.SALIENCY:
-            from seqgra.evaluator.gradientbased import SaliencyEvaluator  # pylint: disable=import-outside-toplevel
-            return SaliencyEvaluator(
-                learner, output_dir, eval_grad_importance_threshold, silent=silent)
-        elif evaluator_id == c.EvaluatorID.FEEDBACK:
-            from seqgra.evaluator.gradientbased import FeedbackEvaluator  # pylint: disable=import-outside-toplevel
-            return FeedbackEvaluator(
-                learner, output_dir, eval_grad_importance_threshold, silent=silent)
-        elif evaluator_id == c.EvaluatorID.GUIDED_BACKPROP:
-            from seqgra.evaluator.gradientbased import GuidedBackpropEvaluator  # pylint: disable=import-outside-toplevel
-            return GuidedBackpropEvaluator(
-                learner, output_dir, eval_grad_importance_threshold, silent=silent)
-        elif evaluator_id == c.EvaluatorID.DECONV:
-            from seqgra.evaluator.gradientbased import DeconvEvaluator  # pylint: disable=import-outside-toplevel
-            return DeconvEvaluator(
-                learner, output_dir, eval_grad_importance_threshold, silent=silent)
-        elif evaluator_id == c.EvaluatorID.SMOOTH_GRAD:
-            from seqgra.evaluator.gradientbased import SmoothGradEvaluator  # pylint: disable=import-outside-toplevel
-            return SmoothGradEvaluator(
-                learner, output_dir, eval_grad_importance_threshold, silent=silent)
-        elif evaluator_id == c.EvaluatorID.INTEGRATED_GRADIENTS:
-            from seqgra.evaluator.gradientbased import IntegratedGradientEvaluator  # pylint: disable=import-outside-toplevel
-            return IntegratedGradientEvaluator(
-                learner, output_dir, eval_grad_importance_threshold, silent=silent)
-        elif evaluator_id == c.EvaluatorID.NONLINEAR_INTEGRATED_GRADIENTS:
-            from seqgra.evaluator.gradientbased import NonlinearIntegratedGradientEvaluator  # pylint: disable=import-outside-toplevel
-            return NonlinearIntegratedGradientEvaluator(
-                learner, output_dir, eval_grad_importance_threshold, silent=silent)
-        elif evaluator_id == c.EvaluatorID.GRAD_CAM:
-            from seqgra.evaluator.gradientbased import GradCamGradientEvaluator  # pylint: disable=import-outside-toplevel
-            return GradCamGradientEvaluator(
-                learner, output_dir, eval_grad_importance_threshold, silent=silent)
-        elif evaluator_id == c.EvaluatorID.DEEP_LIFT:
-            from seqgra.evaluator.gradientbased import DeepLiftEvaluator  # pylint: disable=import-outside-toplevel
-            return DeepLiftEvaluator(
-                learner, output_dir, eval_grad_importance_threshold, silent=silent)
-        elif evaluator_id == c.EvaluatorID.EXCITATION_BACKPROP:
-            from seqgra.evaluator.gradientbased import ExcitationBackpropEvaluator  # pylint: disable=import-outside-toplevel
-            return ExcitationBackpropEvaluator(
-                learner, output_dir, eval_grad_importance_threshold, silent=silent)
-        elif evaluator_id == c.EvaluatorID.CONTRASTIVE_EXCITATION_BACKPROP:
-            from seqgra.evaluator.gradientbased import ContrastiveExcitationBackpropEvaluator  # pylint: disable=import-outside-toplevel
-            return ContrastiveExcitationBackpropEvaluator(
-                learner, output_dir, eval_grad_importance_threshold, silent=silent)
-        else:
+        info = _EVALUATOR_INFO.get(evaluator_id)
+        if info is None:
             raise Exception("invalid evaluator ID")
 
+        evaluator_class = _resolve(info.module, info.cls)
+        if info.kind == "gradient-based":
+            return evaluator_class(learner, output_dir,
+                                   eval_grad_importance_threshold,
+                                   silent=silent)
+        if info.kind == "model-agnostic":
+            return evaluator_class(learner, output_dir,
+                                   eval_sis_predict_threshold,
+                                   silent=silent)
+        return evaluator_class(learner, output_dir, silent)
+
     @staticmethod
     def get_comparator(analysis_id: str, comparator_id: str,
                     output_dir: str,
@@ -293,4 +248,4 @@ class IdResolver:
         elif comparator_id == c.ComparatorID.FEATURE_IMPORTANCE_EVALUATOR_TABLE:
             return FIETableComparator(analysis_id, output_dir, model_labels)
         else:
-            raise Exception("invalid evaluator ID")
\ No newline at end of file
+            raise Exception("invalid evaluator ID")
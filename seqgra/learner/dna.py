@@ -8,11 +8,8 @@ from __future__ import annotations
 
 from typing import List
 import itertools
-import warnings
 
 import numpy as np
-import pandas as pd
-from sklearn.preprocessing import MultiLabelBinarizer
 
 from seqgra import ExampleSet
 from seqgra.learner import MultiClassClassificationLearner
@@ -30,8 +27,7 @@ class DNAMultiClassClassificationLearner(MultiClassClassificationLearner):
         self.alphabet_size: int = 4
 
     def encode_x(self, x: List[str]):
-        return np.stack([DNAHelper.convert_dense_to_one_hot_encoding(seq)
-                         for seq in x])
+        return DNAHelper.convert_dense_to_one_hot_encoding_batch(x)
 
     def decode_x(self, x):
         return np.stack([DNAHelper.convert_one_hot_to_dense_encoding(seq)
@@ -41,8 +37,24 @@ class DNAMultiClassClassificationLearner(MultiClassClassificationLearner):
         if self.definition.labels is None:
             raise Exception("unknown labels, call parse_examples_data or "
                             "load_model first")
-        labels = np.array(self.definition.labels)
-        return np.vstack([ex == labels for ex in y])
+        # one searchsorted call maps all labels to class indices; rows
+        # with unknown labels stay all-False as before; the sorted
+        # vocabulary is cached across calls
+        lookup = getattr(self, "_label_lookup", None)
+        if lookup is None or lookup[0] is not self.definition.labels:
+            labels = np.asarray(self.definition.labels)
+            order = np.argsort(labels)
+            lookup = (self.definition.labels, labels, order, labels[order])
+            self._label_lookup = lookup
+        _, labels, order, sorted_labels = lookup
+        y_arr = np.asarray(y)
+        pos = np.searchsorted(sorted_labels, y_arr)
+        codes = order[np.minimum(pos, len(labels) - 1)]
+        valid = labels[codes] == y_arr
+        encoded_y = np.zeros((len(y_arr), len(labels)), dtype=bool)
+        rows = np.flatnonzero(valid)
+        encoded_y[rows, codes[rows]] = True
+        return encoded_y
 
     def decode_y(self, y):
         if self.definition.labels is None:
@@ -78,11 +90,7 @@ class DNAMultiClassClassificationLearner(MultiClassClassificationLearner):
         return decoded_y
 
     def parse_examples_data(self, file_name: str) -> ExampleSet:
-        df = pd.read_csv(file_name, sep="\t", dtype={"x": "string",
-                                                     "y": "string"})
-        df = df.fillna("")
-        x: List[str] = df["x"].tolist()
-        y: List[str] = df["y"].tolist()
+        x, y = self._parse_examples_file(file_name)
 
         if self.validate_data:
             self.check_sequence(x)
@@ -102,8 +110,7 @@ class DNAMultiLabelClassificationLearner(MultiLabelClassificationLearner):
         self.alphabet_size: int = 4
 
     def encode_x(self, x: List[str]):
-        return np.stack([DNAHelper.convert_dense_to_one_hot_encoding(seq)
-                         for seq in x])
+        return DNAHelper.convert_dense_to_one_hot_encoding_batch(x)
 
     def decode_x(self, x):
         return np.stack([DNAHelper.convert_one_hot_to_dense_encoding(seq)
@@ -114,13 +121,21 @@ class DNAMultiLabelClassificationLearner(MultiLabelClassificationLearner):
             raise Exception("unknown labels, call parse_examples_data or "
                             "load_model first")
 
-        y = [ex.split("|") for ex in y]
-        mlb = MultiLabelBinarizer(classes=self.definition.labels)
-
-        with warnings.catch_warnings():
-            warnings.simplefilter("ignore")
-            y = mlb.fit_transform(y).astype(bool)
-        return y
+        lookup = getattr(self, "_label_lookup", None)
+        if lookup is None or lookup[0] is not self.definition.labels:
+            lookup = (self.definition.labels,
+                      {label: i
+                       for i, label in enumerate(self.definition.labels)})
+            self._label_lookup = lookup
+        label_index = lookup[1]
+        encoded_y = np.zeros((len(y), len(label_index)), dtype=bool)
+        for i, multilabel in enumerate(y):
+            if multilabel:
+                for label in multilabel.split("|"):
+                    j = label_index.get(label)
+                    if j is not None:
+                        encoded_y[i, j] = True
+        return encoded_y
 
     def decode_y(self, y):
         if self.definition.labels is None:
@@ -153,11 +168,7 @@ class DNAMultiLabelClassificationLearner(MultiLabelClassificationLearner):
         return decoded_y
 
     def parse_examples_data(self, file_name: str) -> ExampleSet:
-        df = pd.read_csv(file_name, sep="\t", dtype={"x": "string",
-                                                     "y": "string"})
-        df = df.fillna("")
-        x: List[str] = df["x"].tolist()
-        y: List[str] = df["y"].replace(np.nan, "", regex=True).tolist()
+        x, y = self._parse_examples_file(file_name)
 
         if self.validate_data:
             self.check_sequence(x)
@@ -10,19 +10,63 @@ from typing import List
 
 import numpy as np
 
+try:
+    import numba
+    _NUMBA_AVAILABLE: bool = True
+except ImportError:
+    _NUMBA_AVAILABLE: bool = False
+
+
+def _build_one_hot_lut() -> np.ndarray:
+    # maps ASCII codes to one-hot rows; characters other than
+    # 'A', 'C', 'G', 'T' (case-insensitive) get the uniform 0.25 row
+    lut = np.full((256, 4), 0.25, dtype=np.float32)
+    for i, nt in enumerate("ACGT"):
+        row = np.zeros(4, dtype=np.float32)
+        row[i] = 1.0
+        lut[ord(nt)] = row
+        lut[ord(nt.lower())] = row
+    return lut
+
+
+_ONE_HOT_LUT = _build_one_hot_lut()
+
+if _NUMBA_AVAILABLE:
+    @numba.njit(cache=True, parallel=True)
+    def _encode_one_hot_parallel(buf, lut, out):
+        for i in numba.prange(buf.shape[0]):
+            for j in range(buf.shape[1]):
+                b = buf[i, j]
+                for k in range(lut.shape[1]):
+                    out[i, j, k] = lut[b, k]
+
 
 class DNAHelper:
     @staticmethod
     def convert_dense_to_one_hot_encoding(seq: str):
-        nt_to_num = dict({"A": 0, "C": 1, "G": 2, "T": 3})
-        seq = list(seq.upper())
-        one_hot_encoded_seq = np.zeros((len(seq), len(nt_to_num)))
-        for i, char in enumerate(seq):
-            if char in nt_to_num:
-                one_hot_encoded_seq[i, nt_to_num[char]] = 1
-            else:
-                one_hot_encoded_seq[i, :] = 0.25
-        return one_hot_encoded_seq
+        return _ONE_HOT_LUT[np.frombuffer(seq.encode("latin-1"),
+                                          dtype=np.uint8)]
+
+    @staticmethod
+    def convert_dense_to_one_hot_encoding_batch(seqs: List[str]):
+        if not seqs:
+            return np.zeros((0, 0, 4), dtype=np.float32)
+
+        length: int = len(seqs[0])
+        if all(len(seq) == length for seq in seqs):
+            # one LUT gather over the concatenated byte buffer instead
+            # of per-character Python dispatch
+            buf = np.frombuffer("".join(seqs).encode("latin-1"),
+                                dtype=np.uint8).reshape(len(seqs), length)
+            if _NUMBA_AVAILABLE and buf.size > 1000000:
+                # compiled parallel gather for very large corpora
+                out = np.empty((len(seqs), length, 4), dtype=np.float32)
+                _encode_one_hot_parallel(buf, _ONE_HOT_LUT, out)
+                return out
+            return _ONE_HOT_LUT[buf]
+
+        return np.stack([DNAHelper.convert_dense_to_one_hot_encoding(seq)
+                         for seq in seqs])
 
     @staticmethod
     def convert_one_hot_to_dense_encoding(seq: str):
@@ -9,17 +9,53 @@ Classes:
     - :class:`MultivariateRegressionLearner`: abstract class for multivariate regression learners
 """
 from abc import ABC, abstractmethod
+import csv
 import logging
 import os
 import re
 from typing import Any, List, Optional, Set
 
+import numpy as np
 import pandas as pd
 
+try:
+    import pyarrow as pa
+    import pyarrow.compute as pc
+    import pyarrow.csv as pacsv
+    _PYARROW_AVAILABLE: bool = True
+except ImportError:
+    _PYARROW_AVAILABLE: bool = False
+
+try:
+    import numba
+    _NUMBA_AVAILABLE: bool = True
+except ImportError:
+    _NUMBA_AVAILABLE: bool = False
+
 from seqgra import AnnotationSet, ExampleSet, MiscHelper, ModelSize
 import seqgra.constants as c
 from seqgra.model import ModelDefinition
 
+_ANNOTATION_PATTERN = re.compile(r"[_GC]*")
+
+# deletes all allowed annotation characters; a valid annotation
+# translates to the empty string
+_ANNOTATION_DELETE_TABLE = str.maketrans("", "", "_GC")
+
+if _NUMBA_AVAILABLE:
+    @numba.njit(cache=True, parallel=True)
+    def _validate_annotation_buffer(buf, offsets):
+        num_annotations = offsets.shape[0] - 1
+        valid = np.ones(num_annotations, dtype=np.bool_)
+        for i in numba.prange(num_annotations):
+            annotation_valid = True
+            for p in range(offsets[i], offsets[i + 1]):
+                b = buf[p]
+                # branchless compare against '_', 'G', 'C'
+                annotation_valid &= (b == 95) | (b == 71) | (b == 67)
+            valid[i] = annotation_valid
+        return valid
+
 
 class Learner(ABC):
     """Abstract base class for all learners.
@@ -101,8 +137,9 @@ class Learner(ABC):
             Exception: specify either file_name_train and file_name_val
                 or x_train, y_train, x_val, y_val
         """
-        if len(os.listdir(self.output_dir)) > 0:
-            raise Exception("output directory non-empty")
+        with os.scandir(self.output_dir) as entries:
+            if next(entries, None) is not None:
+                raise Exception("output directory non-empty")
 
         self.set_seed()
 
@@ -208,6 +245,39 @@ class Learner(ABC):
                 y (List[str]): labels
         """
 
+    def _parse_examples_file(self, file_name: str):
+        """Parse an examples file into x and y columns.
+
+        Uses the Arrow CSV reader when pyarrow is available, which
+        memory-maps the file and parses in C instead of materializing
+        an intermediate data frame.
+
+        Arguments:
+            file_name (str): file name
+
+        Returns:
+            Tuple[List[str], List[str]]: sequences and labels
+        """
+        if _PYARROW_AVAILABLE:
+            table = pacsv.read_csv(
+                file_name,
+                parse_options=pacsv.ParseOptions(delimiter="\t"),
+                convert_options=pacsv.ConvertOptions(
+                    column_types={"x": pa.large_string(),
+                                  "y": pa.large_string()},
+                    include_columns=["x", "y"],
+                    strings_can_be_null=True,
+                    null_values=[""]))
+            x: List[str] = table.column("x").fill_null("").to_pylist()
+            y: List[str] = table.column("y").fill_null("").to_pylist()
+        else:
+            df = pd.read_csv(file_name, sep="\t", dtype={"x": "string",
+                                                         "y": "string"})
+            df = df.fillna("")
+            x: List[str] = df["x"].tolist()
+            y: List[str] = df["y"].tolist()
+        return x, y
+
     def parse_annotations_data(self, file_name: str) -> AnnotationSet:
         """Method to parse annotations data file.
 
@@ -221,11 +291,33 @@ class Learner(ABC):
                 annotations (List[str]): annotations
                 y (List[str]): labels
         """
-        df = pd.read_csv(file_name, sep="\t", dtype={"annotation": "string",
-                                                     "y": "string"})
-        df = df.fillna("")
-        annotations: List[str] = df["annotation"].tolist()
-        y: List[str] = df["y"].tolist()
+        if _PYARROW_AVAILABLE:
+            # the Arrow CSV reader streams the file in blocks instead of
+            # materializing an intermediate data frame
+            table = pacsv.read_csv(
+                file_name,
+                parse_options=pacsv.ParseOptions(delimiter="\t"),
+                convert_options=pacsv.ConvertOptions(
+                    column_types={"annotation": pa.large_string(),
+                                  "y": pa.large_string()},
+                    include_columns=["annotation", "y"],
+                    strings_can_be_null=True,
+                    null_values=[""]))
+            annotations: List[str] = \
+                table.column("annotation").fill_null("").to_pylist()
+            y: List[str] = table.column("y").fill_null("").to_pylist()
+        else:
+            # streams the two columns directly into lists without an
+            # intermediate data frame
+            annotations: List[str] = []
+            y: List[str] = []
+            with open(file_name, "r", encoding="utf-8", newline="") as f:
+                reader = csv.reader(f, delimiter="\t")
+                # skip header
+                next(reader, None)
+                for row in reader:
+                    annotations.append(row[0] if row else "")
+                    y.append(row[1] if len(row) > 1 else "")
 
         if self.validate_data:
             self.check_annotations(annotations)
@@ -241,34 +333,84 @@ class Learner(ABC):
         pass
 
     def check_labels(self, y: List[str], throw_exception: bool = True) -> bool:
-        is_valid: bool = True
         if isinstance(self.definition.labels, list):
             model_labels: Set[str] = set(self.definition.labels)
         else:
             model_labels: Set[str] = {self.definition.labels}
 
-        for label in self.get_label_set(y):
-            if not label in model_labels:
-                message: str = "examples with invalid label: " + \
-                    label + " (valid labels are " + \
-                    ", ".join(self.definition.labels) + ")"
-                if throw_exception:
-                    raise Exception(message)
+        label_set: Set[str] = self.get_label_set(y)
+        if _PYARROW_AVAILABLE and len(label_set) > 256:
+            # vectorized membership kernel for high-cardinality label sets
+            unique_labels: List[str] = list(label_set)
+            mask = pc.is_in(
+                pa.array(unique_labels, type=pa.string()),
+                value_set=pa.array(list(model_labels), type=pa.string()))
+            invalid_labels: Set[str] = {
+                label for label, valid in zip(unique_labels,
+                                              mask.to_pylist())
+                if not valid}
+        else:
+            invalid_labels: Set[str] = label_set - model_labels
+        if invalid_labels:
+            message: str = "examples with invalid labels: " + \
+                ", ".join(sorted(invalid_labels)) + " (valid labels are " + \
+                ", ".join(self.definition.labels) + ")"
+            if throw_exception:
+                raise Exception(message)
 
-                self.logger.warning(message)
-                is_valid = False
+            self.logger.warning(message)
+            return False
 
-        return is_valid
+        return True
 
     def check_annotations(self, annotations: List[str]) -> bool:
-        is_valid: bool = True
-        for annotation in annotations:
-            if not re.match("^[\_GC]*$", annotation):
+        if not self.validate_data:
+            return True
+
+        if len(annotations) > 1000:
+            mask = None
+            if _NUMBA_AVAILABLE:
+                try:
+                    # compiled byte scan over one concatenated buffer;
+                    # annotations with non-latin-1 characters cannot be
+                    # byte-encoded and are handled by the regex path
+                    buf = np.frombuffer(
+                        "".join(annotations).encode("latin-1"),
+                        dtype=np.uint8)
+                except UnicodeEncodeError:
+                    buf = None
+                if buf is not None:
+                    lengths = np.fromiter((len(a) for a in annotations),
+                                          dtype=np.int64,
+                                          count=len(annotations))
+                    offsets = np.zeros(len(annotations) + 1, dtype=np.int64)
+                    np.cumsum(lengths, out=offsets[1:])
+                    mask = _validate_annotation_buffer(buf, offsets)
+            if mask is None:
+                # vectorized regex over the whole column; only invalid
+                # entries drop back into Python for warning emission
+                mask = pd.Series(annotations, dtype="string").str.fullmatch(
+                    _ANNOTATION_PATTERN.pattern).to_numpy(na_value=False)
+            invalid_idx = np.flatnonzero(~mask)
+            for i in invalid_idx:
                 self.logger.warning("example with invalid annotation "
                                     "(only 'G' for grammar position, 'C' for "
                                     "confounding position, and '_' for "
                                     "background "
-                                    "position allowed): %s", annotation)
+                                    "position allowed): %s", annotations[i])
+            return invalid_idx.size == 0
+
+        is_valid: bool = True
+        warn = self.logger.warning
+        for annotation in annotations:
+            if not annotation:
+                continue
+            if annotation.translate(_ANNOTATION_DELETE_TABLE):
+                warn("example with invalid annotation "
+                     "(only 'G' for grammar position, 'C' for "
+                     "confounding position, and '_' for "
+                     "background "
+                     "position allowed): %s", annotation)
                 is_valid = False
 
         return is_valid
@@ -289,8 +431,9 @@ class Learner(ABC):
         Raises:
             Exception: in case requested examples file does not exist
         """
-        f: str = self.data_dir + "/" + set_name + ".txt"
-        f = f.replace("\\", "/").replace("//", "/").strip()
+        # data_dir is already normalized (with trailing slash) by
+        # MiscHelper.prepare_path
+        f: str = self.data_dir + set_name + ".txt"
         if os.path.isfile(f):
             return f
         else:
@@ -312,8 +455,7 @@ class Learner(ABC):
         Raises:
             Exception: in case requested annotations file does not exist
         """
-        f: str = self.data_dir + "/" + set_name + "-annotation.txt"
-        f = f.replace("\\", "/").replace("//", "/").strip()
+        f: str = self.data_dir + set_name + "-annotation.txt"
         if os.path.isfile(f):
             return f
         else:
@@ -458,10 +600,7 @@ class MultiClassClassificationLearner(Learner):
                             self.definition.task + "' instead")
 
     def get_label_set(self, y: List[str]) -> Set[str]:
-        if isinstance(y, list):
-            return set(y)
-        else:
-            return {y}
+        return {y} if isinstance(y, str) else set(y)
 
 
 class MultiLabelClassificationLearner(Learner):
@@ -510,16 +649,19 @@ class MultiLabelClassificationLearner(Learner):
                             self.definition.task, "' instead")
 
     def get_label_set(self, y: List[str]) -> Set[str]:
-        if isinstance(y, list):
-            multilabels = set(y)
-        else:
-            multilabels = {y}
+        multilabels = {y} if isinstance(y, str) else set(y)
+
+        if len(multilabels) > 1000:
+            # one big join and a single C-level split beats splitting
+            # each multilabel individually
+            joined: str = "|".join(filter(None, multilabels))
+            return set(joined.split("|")) if joined else set()
 
-        temp: List[str] = list()
+        labels: Set[str] = set()
         for multilabel in multilabels:
-            if len(multilabel) > 0:
-                temp += multilabel.split("|")
-        return set(temp)
+            if multilabel:
+                labels.update(multilabel.split("|"))
+        return labels
 
 
 class MultipleRegressionLearner(Learner):
@@ -573,10 +715,11 @@ class MultipleRegressionLearner(Learner):
 
     def check_labels(self, y: List[str], throw_exception: bool = True) -> bool:
         try:
-            for value in y:
-                float(value)
+            # parses the entire list in one C-level pass instead of
+            # calling float() per label
+            np.asarray(y, dtype=np.float64)
             return True
-        except ValueError:
+        except (ValueError, TypeError):
             message: str = "all labels must be numeric in regression"
             if throw_exception:
                 raise Exception(message)
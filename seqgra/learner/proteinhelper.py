@@ -10,20 +10,42 @@ from typing import List
 
 import numpy as np
 
+_AMINO_ACIDS = "ARNDCEQGHILKMFPSTWYV"
+
+
+def _build_one_hot_lut() -> np.ndarray:
+    # maps ASCII codes to one-hot rows; characters outside the 20
+    # canonical amino acids get the all-zero row
+    lut = np.zeros((256, len(_AMINO_ACIDS)), dtype=np.float32)
+    for i, aa in enumerate(_AMINO_ACIDS):
+        lut[ord(aa), i] = 1.0
+    return lut
+
+
+_ONE_HOT_LUT = _build_one_hot_lut()
+
 
 class ProteinHelper:
     @staticmethod
     def convert_dense_to_one_hot_encoding(seq: str):
-        aa_to_num = dict({"A": 0, "R": 1, "N": 2, "D": 3, "C": 4,
-                          "E": 5, "Q": 6, "G": 7, "H": 8, "I": 9,
-                          "L": 10, "K": 11, "M": 12, "F": 13, "P": 14,
-                          "S": 15, "T": 16, "W": 17, "Y": 18, "V": 19})
-        seq = list(seq)
-        seq = np.array([aa_to_num[aa] for aa in seq], dtype=int)
+        return _ONE_HOT_LUT[np.frombuffer(seq.encode("latin-1"),
+                                          dtype=np.uint8)]
+
+    @staticmethod
+    def convert_dense_to_one_hot_encoding_batch(seqs: List[str]):
+        if not seqs:
+            return np.zeros((0, 0, len(_AMINO_ACIDS)), dtype=np.float32)
+
+        length: int = len(seqs[0])
+        if all(len(seq) == length for seq in seqs):
+            # one LUT gather over the concatenated byte buffer instead
+            # of per-character Python dispatch
+            buf = np.frombuffer("".join(seqs).encode("latin-1"),
+                                dtype=np.uint8).reshape(len(seqs), length)
+            return _ONE_HOT_LUT[buf]
 
-        one_hot_encoded_seq = np.zeros((len(seq), len(aa_to_num)))
-        one_hot_encoded_seq[np.arange(len(seq)), seq] = 1
-        return one_hot_encoded_seq
+        return np.stack([ProteinHelper.convert_dense_to_one_hot_encoding(seq)
+                         for seq in seqs])
 
     @staticmethod
     def convert_one_hot_to_dense_encoding(seq: str):
@@ -5,8 +5,9 @@ PyTorch DataSet class
 @author: Konstantin Krismer
 """
 from collections import deque
+import os
 import random
-from typing import Any, Deque, List, Tuple
+from typing import Any, Deque, List, Optional, Tuple
 
 import torch
 import numpy as np
@@ -14,19 +15,17 @@ import numpy as np
 from seqgra.learner import Learner
 
 
-class MultiClassDataSet(torch.utils.data.Dataset):
-    def __init__(self, x, y=None):
-        self.x = x
-        self.y = y
+class RawStringDataSet(torch.utils.data.Dataset):
+    """Map-style dataset over raw sequence strings.
 
-        self.x = np.array(self.x).astype(np.float32)
+    Stores one byte per character instead of the full one-hot tensor;
+    combine with :func:`get_one_hot_collate_fn` so encoding runs
+    per batch inside the DataLoader workers.
+    """
 
-        if self.y is not None:
-            if not isinstance(self.y, np.ndarray):
-                self.y = np.array(self.y)
-
-            if self.y.dtype == np.bool:
-                self.y = np.argmax(self.y.astype(np.int64), axis=1)
+    def __init__(self, x: List[str], y: Optional[List[str]] = None):
+        self.x = x
+        self.y = y
 
     def __len__(self):
         return len(self.x)
@@ -41,124 +40,108 @@ class MultiClassDataSet(torch.utils.data.Dataset):
             return self.x[idx], self.y[idx]
 
 
-class MultiLabelDataSet(torch.utils.data.Dataset):
-    def __init__(self, x, y=None):
+def get_one_hot_collate_fn(learner: Learner, contains_y: bool = True):
+    """Build a collate_fn that one-hot encodes raw strings per batch.
+
+    Encoding batch_size sequences in each DataLoader worker scales with
+    num_workers and keeps peak memory at one batch instead of the whole
+    corpus.
+    """
+    if contains_y:
+        def collate(batch):
+            x_vec, y_vec = zip(*batch)
+            x = torch.from_numpy(np.asarray(learner.encode_x(list(x_vec)),
+                                            dtype=np.float32))
+            y = torch.from_numpy(np.asarray(learner.encode_y(list(y_vec))))
+            return x, y
+    else:
+        def collate(batch):
+            return torch.from_numpy(np.asarray(learner.encode_x(list(batch)),
+                                               dtype=np.float32))
+    return collate
+
+
+class EncodedDataSet(torch.utils.data.Dataset):
+    """Base class for map-style datasets over pre-encoded arrays.
+
+    Subclasses only provide the task-specific y conversion; x handling,
+    caching, and indexing are shared.
+    """
+
+    def __init__(self, x, y=None, cache_path: Optional[str] = None,
+                 channels_last: bool = False):
         self.x = x
         self.y = y
 
-        self.x = np.array(self.x).astype(np.float32)
+        # store tensors so the default collate indexes them directly
+        # instead of copying numpy slices per item, and so
+        # pin_memory=True takes effect
+        if cache_path is not None and os.path.isfile(cache_path):
+            # memory-mapped pages are shared across DataLoader workers
+            self.x = torch.from_numpy(np.load(cache_path, mmap_mode="c"))
+        else:
+            self.x = torch.from_numpy(
+                np.ascontiguousarray(self.x, dtype=np.float32))
+            if cache_path is not None:
+                np.save(cache_path, self.x.numpy(), allow_pickle=False)
+
+        if channels_last and self.x.dim() == 4:
+            # NHWC strides feed TensorCore convolution kernels without
+            # a permute at the model boundary
+            self.x = self.x.to(memory_format=torch.channels_last)
 
         if self.y is not None:
             if not isinstance(self.y, np.ndarray):
                 self.y = np.array(self.y)
 
-            if self.y.dtype == np.bool:
-                self.y = self.y.astype(np.float32)
+            self.y = torch.from_numpy(
+                np.ascontiguousarray(self._convert_y(self.y)))
 
-    def __len__(self):
-        return len(self.x)
+        # resolve the x-only vs (x, y) case once instead of branching
+        # on every __getitem__ call; tensor indices index the stored
+        # tensors directly
+        self._get = self._get_x if self.y is None else self._get_xy
 
-    def __getitem__(self, idx):
-        if torch.is_tensor(idx):
-            idx = idx.tolist()
+    def _convert_y(self, y):
+        raise NotImplementedError()
 
-        if self.y is None:
-            return self.x[idx]
-        else:
-            return self.x[idx], self.y[idx]
+    def _get_x(self, idx):
+        return self.x[idx]
 
+    def _get_xy(self, idx):
+        return self.x[idx], self.y[idx]
 
-class IterableMultiClassDataSet(torch.utils.data.IterableDataset):
-    def __init__(self, file_name: str, learner: Learner, shuffle: bool = False,
-                 contains_y: bool = True, cache_size: int = 10000):
-        self.file_name: str = file_name
-        self.learner: Learner = learner
-        self.shuffle: bool = shuffle
-        self.contains_y: bool = contains_y
-        self.cache_size: int = cache_size
-        self.x_cache = None
-        self.y_cache = None
-        self.cache_index: int = cache_size
-
-    def __iter__(self):
-        with open(self.file_name, "r") as f:
-            # skip header
-            next(f)
-
-            x, y = self._get_next_example(f)
-            while x is not None:
-                if self.contains_y:
-                    yield x, y
-                else:
-                    yield x
-
-                x, y = self._get_next_example(f)
-
-    def _get_next_example(self, file_handle) -> Tuple[Any, Any]:
-        if self.x_cache is None or self.cache_index >= self.x_cache.shape[0]:
-            # read next chunk in memory
-            x_vec: List[str] = list()
-            y_vec: List[str] = list()
-
-            line: str = file_handle.readline()
-            i = 1
-            while line and i <= self.cache_size:
-                cells: List[str] = line.split("\t")
-
-                if len(cells) == 2 or (len(cells) == 1 and not self.contains_y):
-                    x_vec.append(cells[0].strip())
+    def __len__(self):
+        return len(self.x)
 
-                    if self.contains_y:
-                        y_vec.append(cells[1].strip())
-                else:
-                    raise Exception("invalid example: " + line)
+    def __getitem__(self, idx):
+        return self._get(idx)
 
-                line = file_handle.readline()
-                i += 1
 
-            if x_vec:
-                # validate data
-                if self.learner.validate_data:
-                    self.learner.check_sequence(x_vec)
-                    if self.contains_y:
-                        self.learner.check_labels(y_vec)
+class MultiClassDataSet(EncodedDataSet):
+    def _convert_y(self, y):
+        if np.issubdtype(y.dtype, np.bool_):
+            # argmax on the bool matrix yields int64 indices directly,
+            # without materializing an int64 copy of the full one-hot
+            # matrix first
+            y = np.argmax(y, axis=1)
+        return y
 
-                # shuffle
-                if self.shuffle:
-                    if self.contains_y:
-                        temp = list(zip(x_vec, y_vec))
-                        random.shuffle(temp)
-                        x_vec, y_vec = zip(*temp)
-                    else:
-                        random.shuffle(x_vec)
 
-                # process chunk in memory
-                encoded_x_vec = self.learner.encode_x(x_vec)
-                if not isinstance(encoded_x_vec, np.ndarray):
-                    encoded_x_vec = np.array(encoded_x_vec)
-                self.x_cache = encoded_x_vec.astype(np.float32)
+class MultiLabelDataSet(EncodedDataSet):
+    def _convert_y(self, y):
+        if np.issubdtype(y.dtype, np.bool_):
+            y = y.astype(np.float32)
+        return y
 
-                if self.contains_y:
-                    encoded_y_vec = self.learner.encode_y(y_vec)
-                    if not isinstance(encoded_y_vec, np.ndarray):
-                        encoded_y_vec = np.array(encoded_y_vec)
-                    self.y_cache = np.argmax(encoded_y_vec.astype(np.int64),
-                                             axis=1)
-                self.cache_index = 0
 
-        if self.x_cache is not None and self.cache_index < self.x_cache.shape[0]:
-            if self.contains_y:
-                example = (self.x_cache[self.cache_index, ...],
-                           self.y_cache[self.cache_index])
-            else:
-                example = (self.x_cache[self.cache_index, ...], None)
-            self.cache_index += 1
-            return example
-        else:
-            return (None, None)
+class IterableDataSet(torch.utils.data.IterableDataset):
+    """Base class for iterable datasets that stream a file in chunks.
 
+    Subclasses only provide the task-specific y-cache encoding; file
+    iteration, validation, shuffling, and chunk caching are shared.
+    """
 
-class IterableMultiLabelDataSet(torch.utils.data.IterableDataset):
     def __init__(self, file_name: str, learner: Learner, shuffle: bool = False,
                  contains_y: bool = True, cache_size: int = 10000):
         self.file_name: str = file_name
@@ -184,6 +167,9 @@ class IterableMultiLabelDataSet(torch.utils.data.IterableDataset):
 
                 x, y = self._get_next_example(f)
 
+    def _encode_y_cache(self, y_vec: List[str]):
+        raise NotImplementedError()
+
     def _get_next_example(self, file_handle) -> Tuple[Any, Any]:
         if self.x_cache is None or self.cache_index >= self.x_cache.shape[0]:
             # read next chunk in memory
@@ -222,17 +208,13 @@ class IterableMultiLabelDataSet(torch.utils.data.IterableDataset):
                     else:
                         random.shuffle(x_vec)
 
-                # process chunk in memory
-                encoded_x_vec = self.learner.encode_x(x_vec)
-                if not isinstance(encoded_x_vec, np.ndarray):
-                    encoded_x_vec = np.array(encoded_x_vec)
-                self.x_cache = encoded_x_vec.astype(np.float32)
+                # process chunk in memory; np.asarray with target dtype
+                # skips the copy when encode_x already returns float32
+                self.x_cache = np.asarray(self.learner.encode_x(x_vec),
+                                          dtype=np.float32)
 
                 if self.contains_y:
-                    encoded_y_vec = self.learner.encode_y(y_vec)
-                    if not isinstance(encoded_y_vec, np.ndarray):
-                        encoded_y_vec = np.array(encoded_y_vec)
-                    self.y_cache = encoded_y_vec.astype(np.float32)
+                    self.y_cache = self._encode_y_cache(y_vec)
                 self.cache_index = 0
 
         if self.x_cache is not None and self.cache_index < self.x_cache.shape[0]:
@@ -245,3 +227,13 @@ class IterableMultiLabelDataSet(torch.utils.data.IterableDataset):
             return example
         else:
             return (None, None)
+
+
+class IterableMultiClassDataSet(IterableDataSet):
+    def _encode_y_cache(self, y_vec: List[str]):
+        return np.argmax(np.asarray(self.learner.encode_y(y_vec)), axis=1)
+
+
+class IterableMultiLabelDataSet(IterableDataSet):
+    def _encode_y_cache(self, y_vec: List[str]):
+        return np.asarray(self.learner.encode_y(y_vec), dtype=np.float32)
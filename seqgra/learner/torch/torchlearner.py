@@ -156,7 +156,9 @@ class TorchDNAMultiClassClassificationLearner(
             # from (N, W, C) to (N, C, W)
             encoded_x = np.transpose(encoded_x, (0, 2, 1))
 
-        return encoded_x
+        # pay for the stride repack once here instead of on every
+        # downstream tensor conversion
+        return np.ascontiguousarray(encoded_x)
 
     def decode_x(self, x):
         if self.definition.input_encoding == "2D":
@@ -302,7 +304,9 @@ class TorchDNAMultiLabelClassificationLearner(
             # from (N, W, C) to (N, C, W)
             encoded_x = np.transpose(encoded_x, (0, 2, 1))
 
-        return encoded_x
+        # pay for the stride repack once here instead of on every
+        # downstream tensor conversion
+        return np.ascontiguousarray(encoded_x)
 
     def decode_x(self, x):
         if self.definition.input_encoding == "2D":
@@ -448,7 +452,9 @@ class TorchProteinMultiClassClassificationLearner(
             # from (N, W, C) to (N, C, W)
             encoded_x = np.transpose(encoded_x, (0, 2, 1))
 
-        return encoded_x
+        # pay for the stride repack once here instead of on every
+        # downstream tensor conversion
+        return np.ascontiguousarray(encoded_x)
 
     def decode_x(self, x):
         if self.definition.input_encoding == "2D":
@@ -594,7 +600,9 @@ class TorchProteinMultiLabelClassificationLearner(
             # from (N, W, C) to (N, C, W)
             encoded_x = np.transpose(encoded_x, (0, 2, 1))
 
-        return encoded_x
+        # pay for the stride repack once here instead of on every
+        # downstream tensor conversion
+        return np.ascontiguousarray(encoded_x)
 
     def decode_x(self, x):
         if self.definition.input_encoding == "2D":
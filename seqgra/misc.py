@@ -4,9 +4,12 @@ Miscellaneous helper functions
 Classes:
     - :class:`MiscHelper`: contains static helper functions
 """
+import hashlib
 import os
+import pickle
 import re
 import shutil
+from typing import Any, Optional
 
 
 class MiscHelper:
@@ -26,11 +29,20 @@ class MiscHelper:
                 if not os.path.isdir(path):
                     raise Exception("directory cannot be created "
                                     "(file with same name exists)")
-                elif len(os.listdir(path)) > 0:
-                    num_files: int = len([name
-                                          for name in os.listdir(path)
-                                          if os.path.isfile(path + name)])
-                    if num_files > 0:
+
+                # single directory pass; scandir exposes the entry type
+                # without a stat call per entry
+                has_entries: bool = False
+                has_files: bool = False
+                with os.scandir(path) as entries:
+                    for entry in entries:
+                        has_entries = True
+                        if entry.is_file():
+                            has_files = True
+                            break
+
+                if has_entries:
+                    if has_files:
                         if not allow_exists:
                             raise Exception("directory cannot be created "
                                             "(non-empty folder with same "
@@ -86,21 +98,79 @@ class MiscHelper:
             print()
 
     @staticmethod
-    def read_config_file(file_name: str) -> str:
-        with open(file_name.strip()) as f:
-            config: str = f.read()
+    def read_config_file(file_name: str) -> bytes:
+        # return the raw bytes; both the minidom parser and the lxml
+        # validator accept bytes directly, so decoding to str here only
+        # to re-encode in the parser would copy the document twice
+        with open(file_name.strip(), "rb") as f:
+            config: bytes = f.read()
         return config
 
+    @staticmethod
+    def get_definition_cache_file(file_name: str) -> str:
+        # deferred to avoid a circular import at package init
+        import seqgra  # pylint: disable=import-outside-toplevel
+
+        # cache key covers package version, path, mtime, and size, so
+        # any change to the config file on disk or a seqgra upgrade
+        # misses the cache
+        stat_result = os.stat(file_name)
+        key: str = "|".join([seqgra.__version__,
+                             os.path.abspath(file_name),
+                             str(stat_result.st_mtime_ns),
+                             str(stat_result.st_size)])
+        digest: str = hashlib.sha256(key.encode()).hexdigest()
+        return os.path.join(os.path.expanduser("~"), ".cache", "seqgra",
+                            digest + ".pkl")
+
+    @staticmethod
+    def load_cached_definition(file_name: str) -> Optional[Any]:
+        try:
+            cache_file: str = MiscHelper.get_definition_cache_file(file_name)
+        except OSError:
+            return None
+
+        try:
+            with open(cache_file, "rb") as f:
+                return pickle.load(f)
+        except FileNotFoundError:
+            return None
+        except Exception:  # pylint: disable=broad-except
+            # caching is best effort; a corrupt or incompatible entry
+            # must never break startup, so drop it and fall back to
+            # XML parsing
+            try:
+                os.remove(cache_file)
+            except OSError:
+                pass
+            return None
+
+    @staticmethod
+    def save_cached_definition(file_name: str, definition: Any) -> None:
+        try:
+            cache_file: str = MiscHelper.get_definition_cache_file(file_name)
+            os.makedirs(os.path.dirname(cache_file), exist_ok=True)
+            with open(cache_file, "wb") as f:
+                pickle.dump(definition, f,
+                            protocol=pickle.HIGHEST_PROTOCOL)
+        except OSError:
+            # caching is best effort; parsing still succeeded
+            pass
+
     @staticmethod
     def format_output_dir(output_dir: str) -> str:
-        output_dir = output_dir.strip().replace("\\", "/")
-        if not output_dir.endswith("/"):
-            output_dir += "/"
-        return output_dir
+        # normpath collapses "//" and "/./" segments in one pass; the
+        # trailing "/" is re-added since callers concatenate onto it
+        output_dir = os.path.normpath(
+            output_dir.strip().replace("\\", "/")).replace("\\", "/")
+        return output_dir + "/"
 
     @staticmethod
     def get_valid_file(data_file: str) -> str:
-        data_file = data_file.replace("\\", "/").replace("//", "/").strip()
+        # normpath collapses any run of separators in one pass, unlike
+        # a single "//" -> "/" replacement
+        data_file = os.path.normpath(
+            data_file.strip().replace("\\", "/")).replace("\\", "/")
         if os.path.isfile(data_file):
             return data_file
         else:
@@ -5,12 +5,16 @@ Architecture class definition, markup language agnostic
 
 @author: Konstantin Krismer
 """
+import io
 from typing import Dict, List, Optional
 
 from seqgra.model.model import Operation
 
 
 class Architecture:
+    __slots__ = ("operations", "hyperparameters", "external_model_path",
+                 "external_model_format", "external_model_class_name")
+
     def __init__(self, operations: Optional[List[Operation]] = None,
                  hyperparameters: Optional[Dict[str, str]] = None,
                  external_model_path: Optional[str] = None,
@@ -30,28 +34,31 @@ class Architecture:
             external_model_class_name
 
     def __str__(self):
-        str_rep = ["Architecture:\n"]
+        # single-pass accumulation; the operation strings are indented
+        # as they are written instead of joined, split, and re-joined
+        buf = io.StringIO()
+        buf.write("Architecture:\n")
 
         if self.operations is not None and len(self.operations) > 0:
-            str_rep += ["\tSequential:\n"]
-            operators_string: List[str] = [str(operation)
-                                           for operation in self.operations]
-            operators_str_rep = "".join(operators_string)
-            str_rep += ["\t\t" + s + "\n"
-                        for s in operators_str_rep.splitlines()]
+            buf.write("\tSequential:\n")
+            for operation in self.operations:
+                for line in str(operation).splitlines():
+                    buf.write("\t\t")
+                    buf.write(line)
+                    buf.write("\n")
 
         if self.hyperparameters is not None and len(self.hyperparameters) > 0:
-            str_rep += ["\tHyperparameters:\n", "\t\t",
-                        str(self.hyperparameters)]
+            buf.write("\tHyperparameters:\n\t\t")
+            buf.write(str(self.hyperparameters))
 
         if self.external_model_path is not None:
-            str_rep += ["\tExternal model path:\n", "\t\t",
-                        self.external_model_path]
+            buf.write("\tExternal model path:\n\t\t")
+            buf.write(self.external_model_path)
         if self.external_model_path is not None:
-            str_rep += ["\tExternal model format:\n", "\t\t",
-                        self.external_model_format]
+            buf.write("\tExternal model format:\n\t\t")
+            buf.write(self.external_model_format)
         if self.external_model_class_name is not None:
-            str_rep += ["\tExternal model class name:\n", "\t\t",
-                        self.external_model_class_name]
+            buf.write("\tExternal model class name:\n\t\t")
+            buf.write(self.external_model_class_name)
 
-        return "".join(str_rep)
+        return buf.getvalue()
@@ -32,6 +32,12 @@ class ModelDefinition:
 
     """
 
+    __slots__ = ("model_id", "name", "description", "task",
+                 "sequence_space", "library", "implementation",
+                 "input_encoding", "labels", "seed", "architecture",
+                 "loss_hyperparameters", "optimizer_hyperparameters",
+                 "training_process_hyperparameters")
+
     def __init__(
             self, model_id: str = "", name: str = "",
             description: str = "",
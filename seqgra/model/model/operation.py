@@ -9,6 +9,8 @@ from typing import Dict, Optional
 
 
 class Operation:
+    __slots__ = ("name", "parameters")
+
     def __init__(self, name: str,
                  parameters: Optional[Dict[str, str]] = None) -> None:
         self.name: str = name
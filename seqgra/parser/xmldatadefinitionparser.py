@@ -6,10 +6,9 @@ Implementation of Parser for XML configuration files
 
 @author: Konstantin Krismer
 """
-import io
 import logging
 import os
-from typing import Any, List, Tuple, Dict
+from typing import Any, List, Tuple, Dict, Union
 from xml.dom.minidom import Document, parseString
 
 import pkg_resources
@@ -42,7 +41,13 @@ class XMLDataDefinitionParser(DataDefinitionParser):
     Strategies.
     """
 
-    def __init__(self, config: str, silent: bool = False) -> None:
+    _xml_schema = None
+    # shared parser; skipping whitespace text nodes and the xml:id
+    # registry makes the libxml2 parse cheaper
+    _xml_parser = etree.XMLParser(remove_blank_text=True, collect_ids=False)
+
+    def __init__(self, config: Union[str, bytes],
+                 silent: bool = False) -> None:
         self.logger = logging.getLogger(__name__)
         if silent:
             self.logger.setLevel(os.environ.get("LOGLEVEL", "WARNING"))
@@ -51,12 +56,18 @@ class XMLDataDefinitionParser(DataDefinitionParser):
             self._dom.getElementsByTagName("general")[0]
         self.validate(config)
 
-    def validate(self, xml_config: str) -> None:
-        xsd_path = pkg_resources.resource_filename("seqgra", "data-config.xsd")
-        xmlschema_doc = etree.parse(xsd_path)
-        xmlschema = etree.XMLSchema(xmlschema_doc)
-        xml_doc = etree.parse(io.BytesIO(xml_config.encode()))
-        xmlschema.assertValid(xml_doc)
+    def validate(self, xml_config: Union[str, bytes]) -> None:
+        cls = type(self)
+        if cls._xml_schema is None:
+            # compile the schema once per process; schema compilation
+            # dominates validation cost for small configuration files
+            xsd_path = pkg_resources.resource_filename("seqgra",
+                                                       "data-config.xsd")
+            cls._xml_schema = etree.XMLSchema(etree.parse(xsd_path))
+        if isinstance(xml_config, str):
+            xml_config = xml_config.encode()
+        xml_doc = etree.fromstring(xml_config, parser=cls._xml_parser)
+        cls._xml_schema.assertValid(xml_doc)
         self.logger.info("seqgra data configuration XML "
                          "file is well-formed and valid")
 
@@ -6,10 +6,9 @@ Implementation of Parser for XML configuration files
 
 @author: Konstantin Krismer
 """
-import io
 import logging
 import os
-from typing import Dict, List, Any
+from typing import Dict, List, Any, Union
 from xml.dom.minidom import Document, parseString
 
 import pkg_resources
@@ -31,22 +30,46 @@ class XMLModelDefinitionParser(ModelDefinitionParser):
     Strategies.
     """
 
-    def __init__(self, config: str, silent: bool = False) -> None:
+    _xml_schema = None
+    # shared parser; skipping whitespace text nodes and the xml:id
+    # registry makes the libxml2 parse cheaper
+    _xml_parser = etree.XMLParser(remove_blank_text=True, collect_ids=False)
+
+    def __init__(self, config: Union[str, bytes],
+                 silent: bool = False) -> None:
         self.logger = logging.getLogger(__name__)
         if silent:
             self.logger.setLevel(os.environ.get("LOGLEVEL", "WARNING"))
         self._dom: Document = parseString(config)
         self._general_element: Any = \
             self._dom.getElementsByTagName("general")[0]
+        # cache element handles once; getElementsByTagName walks the
+        # whole document on every call
+        self._sequential_elements: Any = \
+            self._dom.getElementsByTagName("sequential")
+        self._hyperparameters_elements: Any = \
+            self._dom.getElementsByTagName("hyperparameters")
+        self._external_elements: Any = \
+            self._dom.getElementsByTagName("external")
+        self._loss_elements: Any = self._dom.getElementsByTagName("loss")
+        self._optimizer_elements: Any = \
+            self._dom.getElementsByTagName("optimizer")
+        self._training_process_elements: Any = \
+            self._dom.getElementsByTagName("trainingprocess")
         self.validate(config)
 
-    def validate(self, xml_config: str) -> None:
-        xsd_path = pkg_resources.resource_filename("seqgra",
-                                                   "model-config.xsd")
-        xmlschema_doc = etree.parse(xsd_path)
-        xmlschema = etree.XMLSchema(xmlschema_doc)
-        xml_doc = etree.parse(io.BytesIO(xml_config.encode()))
-        xmlschema.assertValid(xml_doc)
+    def validate(self, xml_config: Union[str, bytes]) -> None:
+        cls = type(self)
+        if cls._xml_schema is None:
+            # compile the schema once per process; schema compilation
+            # dominates validation cost for small configuration files
+            xsd_path = pkg_resources.resource_filename("seqgra",
+                                                       "model-config.xsd")
+            cls._xml_schema = etree.XMLSchema(etree.parse(xsd_path))
+        if isinstance(xml_config, str):
+            xml_config = xml_config.encode()
+        xml_doc = etree.fromstring(xml_config, parser=cls._xml_parser)
+        cls._xml_schema.assertValid(xml_doc)
         self.logger.info("seqgra model configuration XML file "
                          "is well-formed and valid")
 
@@ -105,7 +128,7 @@ class XMLModelDefinitionParser(ModelDefinitionParser):
         return XMLHelper.read_int_node(self._general_element, "seed")
 
     def get_architecture(self) -> Architecture:
-        sequential_element = self._dom.getElementsByTagName("sequential")
+        sequential_element = self._sequential_elements
         if len(sequential_element) == 1:
             operation_elements: Any = \
                 sequential_element[0].getElementsByTagName("operation")
@@ -114,8 +137,7 @@ class XMLModelDefinitionParser(ModelDefinitionParser):
         else:
             operations = None
 
-        hyperparameters_element = \
-            self._dom.getElementsByTagName("hyperparameters")
+        hyperparameters_element = self._hyperparameters_elements
         if len(hyperparameters_element) == 1:
             hyperparameter_elements: Any = \
                 hyperparameters_element[0].getElementsByTagName(
@@ -125,7 +147,7 @@ class XMLModelDefinitionParser(ModelDefinitionParser):
         else:
             hyperparameters = None
 
-        external_element = self._dom.getElementsByTagName("external")
+        external_element = self._external_elements
         if len(external_element) == 1:
             external_model_path: str = \
                 XMLHelper.read_immediate_text_node(external_element[0])
@@ -150,7 +172,7 @@ class XMLModelDefinitionParser(ModelDefinitionParser):
                          dict(operation_element.attributes.items()))
 
     def get_loss_hyperparameters(self) -> Dict[str, str]:
-        loss_element: Any = self._dom.getElementsByTagName("loss")
+        loss_element: Any = self._loss_elements
         if len(loss_element) == 1:
             hyperparameter_elements: Any = \
                 loss_element[0].getElementsByTagName("hyperparameter")
@@ -159,7 +181,7 @@ class XMLModelDefinitionParser(ModelDefinitionParser):
             return None
 
     def get_optimizer_hyperparameters(self) -> Dict[str, str]:
-        optimizer_element: Any = self._dom.getElementsByTagName("optimizer")
+        optimizer_element: Any = self._optimizer_elements
         if len(optimizer_element) == 1:
             hyperparameter_elements: Any = \
                 optimizer_element[0].getElementsByTagName("hyperparameter")
@@ -168,8 +190,7 @@ class XMLModelDefinitionParser(ModelDefinitionParser):
             return None
 
     def get_training_process_hyperparameters(self) -> Dict[str, str]:
-        training_process_element: Any = \
-            self._dom.getElementsByTagName("trainingprocess")
+        training_process_element: Any = self._training_process_elements
         if len(training_process_element) == 1:
             hyperparameter_elements: Any = \
                 training_process_element[0].getElementsByTagName("hyperparameter")
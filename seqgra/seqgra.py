@@ -10,9 +10,12 @@ seqgra complete pipeline:
 @author: Konstantin Krismer
 """
 import argparse
+import concurrent.futures
+import importlib
 import logging
 import os
 import shutil
+import threading
 from typing import List, Optional
 
 import seqgra
@@ -32,6 +35,40 @@ from seqgra.simulator import Simulator
 from seqgra.simulator.heatmap import GrammarPositionHeatmap
 
 
+logger = logging.getLogger(__name__)
+
+# joined once at import so parser construction does not re-sort and
+# re-join the evaluator ID sets on every invocation
+_CONVENTIONAL_EVALUATOR_LIST: str = ", ".join(
+    sorted(c.EvaluatorID.CONVENTIONAL_EVALUATORS))
+_FEATURE_IMPORTANCE_EVALUATOR_LIST: str = ", ".join(
+    sorted(c.EvaluatorID.FEATURE_IMPORTANCE_EVALUATORS))
+
+
+def _prefetch_learner_backend(model_def_file: str) -> None:
+    # importing TensorFlow or PyTorch takes seconds; a quick scan of
+    # the raw model config decides which backend to warm up
+    try:
+        config: bytes = MiscHelper.read_config_file(model_def_file)
+        if c.LibraryType.TORCH.encode() in config:
+            importlib.import_module("seqgra.learner.torch")
+        elif c.LibraryType.TENSORFLOW.encode() in config:
+            importlib.import_module("seqgra.learner.tensorflow")
+    except Exception:  # pylint: disable=broad-except
+        # best effort; get_learner imports the backend either way
+        pass
+
+
+def _dir_nonempty(path: str) -> bool:
+    # short-circuits on the first directory entry instead of
+    # materializing the full os.listdir list
+    try:
+        with os.scandir(path) as entries:
+            return next(entries, None) is not None
+    except FileNotFoundError:
+        return False
+
+
 def run_seqgra(data_def_file: Optional[str],
                data_folder: Optional[str],
                model_def_file: Optional[str],
@@ -50,46 +87,52 @@ def run_seqgra(data_def_file: Optional[str],
                eval_fi_predict_threshold: Optional[float],
                eval_sis_predict_threshold: Optional[float],
                eval_grad_importance_threshold: Optional[float]) -> None:
-    logger = logging.getLogger(__name__)
     if silent:
         logger.setLevel(os.environ.get("LOGLEVEL", "WARNING"))
-    output_dir = MiscHelper.format_output_dir(output_dir.strip())
+    output_dir = MiscHelper.format_output_dir(output_dir)
     new_data: bool = False
     new_model: bool = False
 
     if data_def_file is None:
         data_definition: Optional[DataDefinition] = None
         grammar_id = data_folder.strip()
+        input_dir: str = output_dir + "input/" + grammar_id
         logger.info("loaded experimental data")
-        GrammarPositionHeatmap.create(output_dir + "input/" + grammar_id,
-                                      c.DataSet.TRAINING)
-        GrammarPositionHeatmap.create(output_dir + "input/" + grammar_id,
-                                      c.DataSet.VALIDATION)
-        GrammarPositionHeatmap.create(output_dir + "input/" + grammar_id,
-                                      c.DataSet.TEST)
+        GrammarPositionHeatmap.create(input_dir, c.DataSet.TRAINING)
+        GrammarPositionHeatmap.create(input_dir, c.DataSet.VALIDATION)
+        GrammarPositionHeatmap.create(input_dir, c.DataSet.TEST)
     else:
-        # generate synthetic data
-        data_config = MiscHelper.read_config_file(data_def_file)
-        data_def_parser: DataDefinitionParser = XMLDataDefinitionParser(
-            data_config, silent)
-        data_definition: DataDefinition = data_def_parser.get_data_definition()
+        # generate synthetic data; re-invocations with an unchanged
+        # definition file skip the XML parse entirely
+        data_definition: Optional[DataDefinition] = \
+            MiscHelper.load_cached_definition(data_def_file)
+        if data_definition is None:
+            data_config = MiscHelper.read_config_file(data_def_file)
+            data_def_parser: DataDefinitionParser = XMLDataDefinitionParser(
+                data_config, silent)
+            data_definition = data_def_parser.get_data_definition()
+            MiscHelper.save_cached_definition(data_def_file, data_definition)
         grammar_id: str = data_definition.grammar_id
+        input_dir: str = output_dir + "input/" + grammar_id
         if print_info:
             print(data_definition)
 
         if remove_existing_data:
-            simulator_output_dir: str = output_dir + "input/" + grammar_id
-            if os.path.exists(simulator_output_dir):
-                shutil.rmtree(simulator_output_dir, ignore_errors=True)
+            if os.path.exists(input_dir):
+                shutil.rmtree(input_dir, ignore_errors=True)
                 logger.info("removed existing synthetic data")
 
         simulator = Simulator(data_definition, output_dir + "input", silent)
-        synthetic_data_available: bool = \
-            len(os.listdir(simulator.output_dir)) > 0
+        synthetic_data_available: bool = _dir_nonempty(simulator.output_dir)
         if synthetic_data_available:
             logger.info("loaded previously generated synthetic data")
         else:
             logger.info("generating synthetic data")
+            if model_def_file is not None:
+                # overlap the heavy framework import with simulation
+                threading.Thread(target=_prefetch_learner_backend,
+                                 args=(model_def_file,),
+                                 daemon=True).start()
             simulator.simulate_data()
             new_data = True
 
@@ -103,29 +146,35 @@ def run_seqgra(data_def_file: Optional[str],
 
     # get learner
     if model_def_file is not None:
-        model_config = MiscHelper.read_config_file(model_def_file)
-        model_def_parser: ModelDefinitionParser = XMLModelDefinitionParser(
-            model_config, silent)
-        model_definition: ModelDefinition = \
-            model_def_parser.get_model_definition()
+        model_definition: Optional[ModelDefinition] = \
+            MiscHelper.load_cached_definition(model_def_file)
+        if model_definition is None:
+            model_config = MiscHelper.read_config_file(model_def_file)
+            model_def_parser: ModelDefinitionParser = \
+                XMLModelDefinitionParser(model_config, silent)
+            model_definition = model_def_parser.get_model_definition()
+            MiscHelper.save_cached_definition(model_def_file,
+                                              model_definition)
         if print_info:
             print(model_definition)
 
+        models_dir: str = output_dir + "models/" + grammar_id
+        evaluation_dir: str = output_dir + "evaluation/" + grammar_id + \
+            "/" + model_definition.model_id
+
         if remove_existing_data:
-            learner_output_dir: str = output_dir + "models/" + grammar_id + \
-                "/" + model_definition.model_id
+            learner_output_dir: str = models_dir + "/" + \
+                model_definition.model_id
             if os.path.exists(learner_output_dir):
                 shutil.rmtree(learner_output_dir, ignore_errors=True)
                 logger.info("removed pretrained model")
 
         learner: Learner = IdResolver.get_learner(
-            model_definition, data_definition,
-            output_dir + "input/" + grammar_id,
-            output_dir + "models/" + grammar_id,
+            model_definition, data_definition, input_dir, models_dir,
             not no_checks, gpu_id, silent)
 
         # train model on data
-        trained_model_available: bool = len(os.listdir(learner.output_dir)) > 0
+        trained_model_available: bool = _dir_nonempty(learner.output_dir)
         train_model: bool = not trained_model_available
         if trained_model_available:
             try:
@@ -170,9 +219,16 @@ def run_seqgra(data_def_file: Optional[str],
                     c.DataSet.TRAINING)
                 validation_set_file: str = learner.get_examples_file(
                     c.DataSet.VALIDATION)
-                x_train, y_train = learner.parse_examples_data(
-                    training_set_file)
-                x_val, y_val = learner.parse_examples_data(validation_set_file)
+                # training and validation sets are independent; parse
+                # both files concurrently
+                with concurrent.futures.ThreadPoolExecutor(
+                        max_workers=2) as executor:
+                    training_future = executor.submit(
+                        learner.parse_examples_data, training_set_file)
+                    validation_future = executor.submit(
+                        learner.parse_examples_data, validation_set_file)
+                    x_train, y_train = training_future.result()
+                    x_val, y_val = validation_future.result()
 
                 learner.train_model(x_train=x_train, y_train=y_train,
                                     x_val=x_val, y_val=y_val)
@@ -183,10 +239,8 @@ def run_seqgra(data_def_file: Optional[str],
                 c.LibraryType.BAYES_OPTIMAL_CLASSIFIER
 
         if remove_existing_data:
-            evaluator_output_dir: str = output_dir + "evaluation/" + \
-                grammar_id + "/" + model_definition.model_id
-            if os.path.exists(evaluator_output_dir):
-                shutil.rmtree(evaluator_output_dir, ignore_errors=True)
+            if os.path.exists(evaluation_dir):
+                shutil.rmtree(evaluation_dir, ignore_errors=True)
                 logger.info("removed evaluator results")
 
         if evaluator_ids:
@@ -203,22 +257,30 @@ def run_seqgra(data_def_file: Optional[str],
             else:
                 eval_sets: List[str] = c.DataSet.ALL_SETS
 
-            evaluation_dir: str = output_dir + "evaluation/" + \
-                grammar_id + "/" + learner.definition.model_id
+            # classify all evaluator results directories in one scan
+            # instead of one exists/non-empty check per evaluator
+            if os.path.isdir(evaluation_dir):
+                with os.scandir(evaluation_dir) as entries:
+                    existing_results = {entry.name for entry in entries
+                                        if entry.is_dir() and
+                                        _dir_nonempty(entry.path)}
+            else:
+                existing_results = set()
 
             for evaluator_id in evaluator_ids:
-                results_dir: str = evaluation_dir + "/" + evaluator_id
-                results_exist: bool = os.path.exists(results_dir) and \
-                    len(os.listdir(results_dir)) > 0
-                if results_exist:
+                if evaluator_id in existing_results:
                     logger.info("skip evaluator %s: results already saved "
                                 "to disk", evaluator_id)
-                    if new_model:
+                    if new_model and logger.isEnabledFor(logging.WARNING):
+                        # guard keeps the argument tuple (including the
+                        # rebuilt results path) off the hot path when
+                        # warnings are disabled
                         logger.warning("results from evaluator %s are based "
                                        "on an outdated model; delete "
                                        "'%s' and run seqgra again to get "
                                        "results from %s on current model",
-                                       evaluator_id, results_dir,
+                                       evaluator_id,
+                                       evaluation_dir + "/" + evaluator_id,
                                        evaluator_id)
                 else:
                     evaluator: Evaluator = IdResolver.get_evaluator(
@@ -229,17 +291,18 @@ def run_seqgra(data_def_file: Optional[str],
                     if eval_n_per_label:
                         eval_n = eval_n_per_label
 
-                    for eval_set in eval_sets:
-                        learner.set_seed()
+                    is_fi_evaluator: bool = isinstance(
+                        evaluator, FeatureImportanceEvaluator)
+                    if not is_fi_evaluator:
+                        eval_fi_predict_threshold = None
 
-                        is_fi_evaluator: bool = isinstance(
-                            evaluator, FeatureImportanceEvaluator)
+                    def run_evaluator_on_set(eval_set: str) -> None:
+                        learner.set_seed()
                         if is_fi_evaluator:
                             logger.info("running feature importance "
                                         "evaluator %s on %s set",
                                         evaluator_id, eval_set)
                         else:
-                            eval_fi_predict_threshold = None
                             logger.info("running evaluator %s on %s set",
                                         evaluator_id, eval_set)
 
@@ -249,6 +312,34 @@ def run_seqgra(data_def_file: Optional[str],
                             subset_n_per_label=eval_n_per_label is not None,
                             subset_threshold=eval_fi_predict_threshold,
                             suppress_plots=eval_suppress_plots)
+
+                    if evaluator_id in \
+                            c.EvaluatorID.CONVENTIONAL_EVALUATORS and \
+                            len(eval_sets) > 1 and \
+                            learner.definition.library != \
+                            c.LibraryType.TENSORFLOW and \
+                            eval_suppress_plots and \
+                            eval_n is None and eval_n_per_label is None:
+                        # conventional evaluators are CPU-bound and the
+                        # sets are independent; run them concurrently;
+                        # Keras models are excluded since compiled
+                        # metrics and predict_function are stateful and
+                        # not safe to call from multiple threads; plots
+                        # are excluded since pyplot's current-figure
+                        # state is global; subset selection is excluded
+                        # since per-set set_seed on the shared global
+                        # RNG is only reproducible sequentially
+                        with concurrent.futures.ThreadPoolExecutor(
+                                max_workers=len(eval_sets)) as executor:
+                            futures = [
+                                executor.submit(run_evaluator_on_set,
+                                                eval_set)
+                                for eval_set in eval_sets]
+                            for future in futures:
+                                future.result()
+                    else:
+                        for eval_set in eval_sets:
+                            run_evaluator_on_set(eval_set)
         else:
             logger.info("skipping evaluation step: no evaluator specified")
 
@@ -294,9 +385,9 @@ def create_parser():
         nargs="+",
         help="evaluator ID or IDs: IDs of "
         "conventional evaluators include " +
-        ", ".join(sorted(c.EvaluatorID.CONVENTIONAL_EVALUATORS)) +
+        _CONVENTIONAL_EVALUATOR_LIST +
         "; IDs of feature importance evaluators include " +
-        ", ".join(sorted(c.EvaluatorID.FEATURE_IMPORTANCE_EVALUATORS))
+        _FEATURE_IMPORTANCE_EVALUATOR_LIST
     )
     parser.add_argument(
         "-o",
@@ -425,10 +516,12 @@ def main():
         parser.error("-e/--evaluators requires -m/--model-def-file.")
 
     if args.evaluators is not None:
-        for evaluator in args.evaluators:
-            if evaluator not in c.EvaluatorID.ALL_EVALUATOR_IDS:
-                raise ValueError(
-                    "invalid evaluator ID {s!r}".format(s=evaluator))
+        invalid_evaluator_ids = \
+            set(args.evaluators) - c.EvaluatorID.ALL_EVALUATOR_IDS
+        if invalid_evaluator_ids:
+            raise ValueError(
+                "invalid evaluator ID(s): " +
+                ", ".join(sorted(invalid_evaluator_ids)))
 
     run_seqgra(args.data_def_file,
                args.data_folder,